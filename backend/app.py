@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 # Sprint Planning Copilot API
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from backend.presentation.http.dependencies import shutdown_meeting_queue
 from backend.presentation.http.ui_router import router as ui_router
 
 
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    yield
+    await shutdown_meeting_queue()
+
+
 def create_app() -> FastAPI:
-    app = FastAPI(title="AI Scrum Co-Pilot — Extract API")
+    app = FastAPI(title="AI Scrum Co-Pilot — Extract API", lifespan=lifespan)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=[
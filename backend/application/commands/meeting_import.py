@@ -4,7 +4,7 @@ import uuid
 from dataclasses import dataclass
 
 from backend.domain.entities import MeetingImportJob
-from backend.domain.ports import MeetingImportQueuePort, MeetingsRepositoryPort
+from backend.domain.ports import MeetingImportQueuePort, MeetingQueueFullError, MeetingsRepositoryPort
 from backend.domain.status import MeetingStatus
 
 
@@ -44,6 +44,10 @@ class SubmitMeetingImportCommand:
             blob_url=payload.blob_url,
             original_filename=payload.original_filename,
         )
-        await self._queue.enqueue(job)
+        try:
+            await self._queue.enqueue(job)
+        except MeetingQueueFullError:
+            self._repo.update_meeting_status(meeting_id, MeetingStatus.FAILED.value)
+            raise
         self._repo.update_meeting_status(meeting_id, MeetingStatus.QUEUED.value)
         return meeting_id
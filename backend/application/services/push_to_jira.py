@@ -2,101 +2,237 @@ from __future__ import annotations
 
 import logging
 import re
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from typing import Iterable
 
+from backend.domain.entities import StoredTask
 from backend.domain.ports import MeetingsRepositoryPort
 from backend.infrastructure.jira import JiraClient, JiraClientError, JiraIssue
 
 logger = logging.getLogger(__name__)
 
+JIRA_BULK_CREATE_LIMIT = JiraClient.BULK_CREATE_LIMIT
+# Statuses meaning "some elements are bad"; auth, permission and throttling errors would fail every item alike.
+_BULK_ITEM_REJECTION_STATUSES = frozenset({400, 413})
+# Applied after lower(), so only lowercase alphanumerics, "_" and "-" survive.
+_LABEL_RE = re.compile(r"[^a-z0-9_-]+")
+
+
+def _sanitize_label(label: str) -> str:
+    return _LABEL_RE.sub("-", label.strip().lower()).strip("-_")[:255]
+
 
 @dataclass
 class PushTasksResult:
     total: int
     pushed: int
     skipped: int
+    # (task_id, error message) for every task Jira did not accept.
+    errors: list[tuple[str, str]] = field(default_factory=list)
+
+
+class PushPartialError(JiraClientError):
+    """Raised once a push finishes with failures; the tasks that did succeed are already recorded."""
+
+    def __init__(self, result: PushTasksResult, cause: JiraClientError) -> None:
+        super().__init__(
+            f"{len(result.errors)} of {result.total} tasks failed to push to Jira: {cause}",
+            status_code=cause.status_code,
+            body=cause.body,
+        )
+        self.result = result
+        self.errors = result.errors
 
 
 class PushTasksToJiraService:
     """Pushes approved tasks to Jira and updates local persistence."""
 
-    def __init__(self, *, repo: MeetingsRepositoryPort, jira_client: JiraClient) -> None:
+    def __init__(
+            self,
+            *,
+            repo: MeetingsRepositoryPort,
+            jira_client: JiraClient,
+            max_workers: int = 8,
+            lookup_miss_ttl: timedelta = timedelta(hours=24),
+    ) -> None:
         self._repo = repo
         self._jira = jira_client
+        self._max_workers = max(1, max_workers)
+        self._lookup_miss_ttl = lookup_miss_ttl
 
-    def push(self, task_ids: Iterable[str]) -> PushTasksResult:
+    def push(self, task_ids: Iterable[str], *, raise_on_error: bool = True) -> PushTasksResult:
+        """Push every task it can; failures are collected per task and raised together at the end."""
         ids = [task_id for task_id in task_ids if task_id]
         if not ids:
             return PushTasksResult(total=0, pushed=0, skipped=0)
 
-        tasks = self._repo.get_tasks_by_ids(ids)
-        pushed = 0
+        tasks = [StoredTask.from_dict(row) for row in self._repo.get_tasks_by_ids(ids)]
+        pending: list[StoredTask] = []
         skipped = 0
         for task in tasks:
-            if task.get("jiraIssueKey"):
-                logger.info("Skipping task %s; already pushed as %s", task["id"], task["jiraIssueKey"])
+            if task.jira_issue_key:
+                logger.info("Skipping task %s; already pushed as %s", task.id, task.jira_issue_key)
                 skipped += 1
                 continue
-            assignee_account_id = task.get("assigneeAccountId")
-            if not assignee_account_id:
-                assignee_account_id = self._resolve_assignee_account(task)
-            issue = self._create_issue(task, assignee_account_id=assignee_account_id)
-            self._repo.mark_task_pushed_to_jira(
-                task["id"],
-                issue_key=issue.key,
-                issue_url=issue.url,
+            pending.append(task)
+        if not pending:
+            # Replaying an already-synced sprint: no assignee lookups, payloads or worker pool needed.
+            return PushTasksResult(total=len(tasks), pushed=0, skipped=skipped)
+
+        accounts = self._resolve_assignee_accounts(pending)
+        payloads = [
+            self._issue_payload(
+                task,
+                assignee_account_id=task.assignee_account_id or accounts.get(task.assignee_id),
             )
-            pushed += 1
-        return PushTasksResult(total=len(tasks), pushed=pushed, skipped=skipped)
+            for task in pending
+        ]
+        batches = [
+            (pending[start:start + JIRA_BULK_CREATE_LIMIT], payloads[start:start + JIRA_BULK_CREATE_LIMIT])
+            for start in range(0, len(pending), JIRA_BULK_CREATE_LIMIT)
+        ]
+        pushed_rows: list[tuple[str, str, str | None]] = []
+        errors: list[tuple[str, str]] = []
+        failure: JiraClientError | None = None
+        # Anything other than a Jira error is re-raised, but only once the issues already created are recorded.
+        unexpected: Exception | None = None
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(pending) or 1)) as executor:
+            bulk_futures: list[tuple[list[StoredTask], list[dict], Future[list[JiraIssue | None]]]] = [
+                (batch, batch_payloads, executor.submit(self._bulk_create, batch_payloads))
+                for batch, batch_payloads in batches
+            ]
+            rejected: list[tuple[StoredTask, dict]] = []
+            for batch, batch_payloads, future in bulk_futures:
+                try:
+                    issues = future.result()
+                except JiraClientError as exc:
+                    failure = failure or exc
+                    errors.extend((task.id, str(exc)) for task in batch)
+                    continue
+                except Exception as exc:
+                    logger.exception("Unexpected error bulk pushing %d tasks to Jira", len(batch))
+                    unexpected = unexpected or exc
+                    errors.extend((task.id, str(exc)) for task in batch)
+                    continue
+                for task, payload, issue in zip(batch, batch_payloads, issues):
+                    if issue is None:
+                        rejected.append((task, payload))
+                    else:
+                        pushed_rows.append((task.id, issue.key, issue.url))
+            # Rejected items are retried one by one, fanned out over the same bounded pool.
+            retry_futures: list[tuple[StoredTask, Future[JiraIssue]]] = [
+                (task, executor.submit(self._create_issue, task, payload)) for task, payload in rejected
+            ]
+            for task, future in retry_futures:
+                try:
+                    issue = future.result()
+                except JiraClientError as exc:
+                    failure = failure or exc
+                    errors.append((task.id, str(exc)))
+                    continue
+                except Exception as exc:
+                    logger.exception("Unexpected error pushing task %s to Jira", task.id)
+                    unexpected = unexpected or exc
+                    errors.append((task.id, str(exc)))
+                    continue
+                pushed_rows.append((task.id, issue.key, issue.url))
+        # Repository writes stay on the calling thread and go out in a single bulk update.
+        if pushed_rows:
+            missing = self._repo.mark_tasks_pushed_to_jira(pushed_rows)
+            if missing:
+                # The Jira issues exist regardless; the other links are already stored, so only log these.
+                logger.warning("Tasks %s were deleted before their Jira links could be stored", ", ".join(missing))
+        if unexpected is not None:
+            raise unexpected
+        result = PushTasksResult(total=len(tasks), pushed=len(pushed_rows), skipped=skipped, errors=errors)
+        if failure is not None and raise_on_error:
+            raise PushPartialError(result, failure)
+        return result
 
-    def _create_issue(self, task: dict, *, assignee_account_id: str | None) -> JiraIssue:
+    def _bulk_create(self, payloads: list[dict]) -> list[JiraIssue | None]:
+        """Create a batch through the bulk endpoint; ``None`` marks items to retry individually."""
         try:
-            labels = self._sanitize_labels(task.get("labels") or [])
-            return self._jira.create_issue(
-                summary=task.get("summary", ""),
-                description=task.get("description"),
-                issue_type=task.get("issueType", "Task"),
-                priority=task.get("priority", "Medium"),
-                labels=labels,
-                assignee_account_id=assignee_account_id,
-                story_points=task.get("storyPoints"),
-                source_quote=task.get("sourceQuote"),
-            )
+            return self._jira.bulk_create_issues(payloads)
+        except JiraClientError as exc:
+            if exc.status_code not in _BULK_ITEM_REJECTION_STATUSES:
+                logger.exception("Failed to bulk push %d tasks to Jira", len(payloads))
+                raise
+            logger.warning("Jira rejected bulk create (%s); retrying tasks individually", exc)
+            return [None] * len(payloads)
+
+    def _create_issue(self, task: StoredTask, payload: dict) -> JiraIssue:
+        try:
+            return self._jira.create_issue(payload)
         except JiraClientError:
-            logger.exception("Failed to push task %s to Jira", task.get("id"))
+            logger.exception("Failed to push task %s to Jira", task.id)
             raise
 
-    @staticmethod
-    def _sanitize_labels(labels: list[str]) -> list[str]:
-        sanitized: list[str] = []
-        for label in labels:
-            if not label:
-                continue
-            slug = re.sub(r"[^A-Za-z0-9_-]+", "-", label.strip().lower())
-            slug = slug.strip("-_")
-            if slug:
-                sanitized.append(slug[:255])
-        return sanitized
-
-    def _resolve_assignee_account(self, task: dict) -> str | None:
-        user_id = task.get("assigneeId")
-        if not user_id:
-            return None
-        user = self._repo.get_user(user_id)
+    def _issue_payload(self, task: StoredTask, *, assignee_account_id: str | None) -> dict:
+        return {
+            "summary": task.summary,
+            "description": task.description,
+            "issue_type": task.issue_type,
+            "priority": task.priority,
+            "labels": [slug for label in task.labels if label and (slug := _sanitize_label(label))],
+            "assignee_account_id": assignee_account_id,
+            "story_points": task.story_points,
+            "source_quote": task.source_quote,
+        }
+
+    def _resolve_assignee_accounts(self, tasks: list[StoredTask]) -> dict[str, str | None]:
+        """Map each distinct unlinked assignee to a Jira account, fetching users in one call."""
+        user_ids = {task.assignee_id for task in tasks if task.assignee_id and not task.assignee_account_id}
+        if not user_ids:
+            return {}
+        users = self._repo.get_users(user_ids)
+        now = datetime.now(timezone.utc)
+        # Per-push cache of Jira lookups by display name, misses included, shared across user ids.
+        name_cache: dict[str, str | None] = {}
+        return {
+            user_id: self._resolve_assignee_account(user_id, users.get(user_id), name_cache, now)
+            for user_id in user_ids
+        }
+
+    def _resolve_assignee_account(
+            self,
+            user_id: str,
+            user: dict | None,
+            name_cache: dict[str, str | None],
+            now: datetime,
+    ) -> str | None:
         if not user:
             return None
         account_id = user.get("jiraAccountId")
         if account_id:
             return account_id
         display_name = user.get("displayName")
-        if not display_name:
-            return None
-        try:
-            account_id = self._jira.find_user_account_id(display_name)
-        except JiraClientError:
-            logger.exception("Failed to resolve Jira account for %s", display_name)
+        if not display_name or self._recently_missed(user.get("jiraLookupMissAt"), now):
             return None
+        if display_name in name_cache:
+            account_id = name_cache[display_name]
+        else:
+            try:
+                account_id = self._jira.find_user_account_id(display_name)
+            except JiraClientError:
+                logger.exception("Failed to resolve Jira account for %s", display_name)
+                return None
+            name_cache[display_name] = account_id
         if account_id:
             self._repo.update_user_jira_account(user_id, account_id)
+        else:
+            # Persist the miss so later pushes skip the search until the TTL runs out.
+            self._repo.update_user_jira_lookup_miss(user_id, now.isoformat())
         return account_id
+
+    def _recently_missed(self, missed_at: str | None, now: datetime) -> bool:
+        if not missed_at:
+            return False
+        try:
+            missed = datetime.fromisoformat(missed_at)
+        except ValueError:
+            return False
+        if missed.tzinfo is None:
+            missed = missed.replace(tzinfo=timezone.utc)
+        return now - missed < self._lookup_miss_ttl
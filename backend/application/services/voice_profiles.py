@@ -60,8 +60,13 @@ class VoiceSamplesSyncService:
 
     def _download_blob(self, blob_name: str, destination: Path) -> None:
         blob_client = self._container.get_blob_client(blob_name)
-        data = blob_client.download_blob(max_concurrency=2).readall()
-        destination.write_bytes(data)
+        tmp_path = destination.with_name(f"{destination.name}.part")
+        try:
+            with tmp_path.open("wb") as handle:
+                blob_client.download_blob(max_concurrency=4).readinto(handle)
+            tmp_path.replace(destination)
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
     @staticmethod
     def _display_name_from_blob(blob_name: str) -> str | None:
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import datetime
+import functools
 import os
 import uuid
+from collections.abc import Callable
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TypeVar
 
 from backend import audit
 from backend.domain.entities import MeetingImportJob
@@ -19,6 +24,8 @@ from backend.domain.ports import (
 from backend.domain.status import MeetingStatus
 from backend.schemas import ExtractionResult
 
+T = TypeVar("T")
+
 
 class ExtractionError(RuntimeError):
     """Raised when the extract workflow fails."""
@@ -51,6 +58,7 @@ class ExtractMeetingUseCase:
             meetings_repo: MeetingsRepositoryPort,
             telemetry: TelemetryPort | None,
             audio_extensions: tuple[str, ...] | None = None,
+            io_executor: Executor | None = None,
     ) -> None:
         self._blob_storage = blob_storage
         self._transcription = transcription
@@ -58,6 +66,8 @@ class ExtractMeetingUseCase:
         self._meetings_repo = meetings_repo
         self._telemetry = telemetry
         self._worker_actor = os.getenv("MEETING_WORKER_ACTOR", "meeting-worker")
+        # Blocking SDK calls (transcription, persistence, telemetry) run here instead of the loop's default pool.
+        self._io_executor = io_executor
         if audio_extensions is not None:
             self._audio_extensions = audio_extensions
         elif transcription is not None:
@@ -148,15 +158,28 @@ class ExtractMeetingUseCase:
         transcription = self._transcription
         audio_exts = self._audio_extensions
         if transcription and audio_exts and name_lower.endswith(audio_exts):
-            return await asyncio.to_thread(transcription.transcribe, ctx.payload, name_lower)
+            atranscribe = getattr(transcription, "atranscribe", None)
+            if atranscribe is not None:
+                return await atranscribe(ctx.payload, name_lower)
+            return await self._run_blocking(transcription.transcribe, ctx.payload, name_lower)
         if audio_exts and name_lower.endswith(audio_exts):
             raise ExtractionError("Transcription service is not configured.", status_code=500)
 
         raise ExtractionError("Unsupported file type. Upload .txt, .json, or supported audio.", status_code=400)
 
+    async def _run_blocking(self, func: Callable[..., T], *args) -> T:
+        # Same semantics as asyncio.to_thread: carry the audit actor context into the worker thread.
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(self._io_executor, functools.partial(ctx.run, func, *args))
+
     async def _extract(self, transcript: str) -> ExtractionResult:
+        # Prefer the native coroutine so concurrent jobs share the event loop instead of threads.
+        aextract = getattr(self._extractor, "aextract", None)
         try:
-            return await asyncio.to_thread(self._extractor.extract, transcript)
+            if aextract is not None:
+                return await aextract(transcript)
+            return await self._run_blocking(self._extractor.extract, transcript)
         except Exception as exc:  # pragma: no cover - defensive
             raise ExtractionError(f"Extraction failed: {exc}", status_code=500) from exc
 
@@ -178,7 +201,7 @@ class ExtractMeetingUseCase:
             )
 
         try:
-            return await asyncio.to_thread(_persist)
+            return await self._run_blocking(_persist)
         except Exception as exc:  # pragma: no cover - defensive
             raise ExtractionError(f"Failed to persist results: {exc}", status_code=500) from exc
 
@@ -204,4 +227,4 @@ class ExtractMeetingUseCase:
                 transcript_blob_uri=transcript_blob_uri,
             )
 
-        await asyncio.to_thread(_emit_telemetry)
+        await self._run_blocking(_emit_telemetry)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 
@@ -66,6 +67,7 @@ def get_transcriber() -> AzureConversationTranscriber | None:
         region=cfg.region,
         language=cfg.language,
         sample_rate=cfg.sample_rate,
+        channels=cfg.channels,
         intro_audio_dir=intro_dir,
     )
 
@@ -101,6 +103,14 @@ def get_extractor() -> LLMExtractor:
     return LLMExtractor()
 
 
+@lru_cache(maxsize=1)
+def get_io_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=get_settings().queue.io_workers,
+        thread_name_prefix="meeting-io",
+    )
+
+
 @lru_cache(maxsize=1)
 def get_extract_use_case() -> ExtractMeetingUseCase:
     blob = get_blob_storage()
@@ -115,6 +125,7 @@ def get_extract_use_case() -> ExtractMeetingUseCase:
         meetings_repo=repo,
         telemetry=telemetry,
         audio_extensions=SUPPORTED_AUDIO_EXTENSIONS,
+        io_executor=get_io_executor(),
     )
 
 
@@ -134,7 +145,11 @@ def get_meeting_queue():
         )
     logger.warning("Azure queue configuration missing; falling back to in-process queue")
     use_case = get_extract_use_case()
-    return BackgroundMeetingImportQueue(use_case.process_job)
+    return BackgroundMeetingImportQueue(
+        use_case.process_job,
+        concurrency=settings.queue.local_concurrency,
+        max_depth=settings.queue.local_max_depth,
+    )
 
 
 @lru_cache(maxsize=1)
@@ -170,6 +185,7 @@ def get_jira_client() -> JiraClient | None:
             api_token=cfg.api_token,
             project_key=cfg.project_key,
             story_points_field=cfg.story_points_field,
+            pool_maxsize=max(JiraClient.DEFAULT_POOL_MAXSIZE, cfg.push_max_workers),
         )
     except ValueError:
         return None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
 
 @dataclass(slots=True)
@@ -10,3 +11,36 @@ class MeetingImportJob:
     started_at: str
     blob_url: str
     original_filename: str | None = None
+
+
+@dataclass(slots=True)
+class StoredTask:
+    """Typed view of a persisted task row, as returned by the meetings repository."""
+
+    id: str
+    summary: str
+    description: str | None = None
+    issue_type: str = "Task"
+    priority: str = "Medium"
+    story_points: int | None = None
+    labels: list[str] = field(default_factory=list)
+    assignee_id: str | None = None
+    assignee_account_id: str | None = None
+    jira_issue_key: str | None = None
+    source_quote: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> StoredTask:
+        return cls(
+            id=data["id"],
+            summary=data.get("summary", ""),
+            description=data.get("description"),
+            issue_type=data.get("issueType", "Task"),
+            priority=data.get("priority", "Medium"),
+            story_points=data.get("storyPoints"),
+            labels=data.get("labels") or [],
+            assignee_id=data.get("assigneeId"),
+            assignee_account_id=data.get("assigneeAccountId"),
+            jira_issue_key=data.get("jiraIssueKey"),
+            source_quote=data.get("sourceQuote"),
+        )
@@ -73,11 +73,14 @@ class MeetingsRepositoryPort(Protocol):
         """Update status for multiple tasks."""
 
     def get_tasks_by_ids(self, ids: Iterable[str]) -> list[dict[str, Any]]:
-        """Return tasks by ID preserving metadata."""
+        """Return tasks by ID preserving metadata, fetched in bulk rather than one query per ID."""
 
     def mark_task_pushed_to_jira(self, task_id: str, *, issue_key: str, issue_url: str | None) -> None:
         """Record Jira issue linkage."""
 
+    def mark_tasks_pushed_to_jira(self, rows: Iterable[tuple[str, str, str | None]]) -> list[str]:
+        """Record Jira issue linkage for many (task_id, issue_key, issue_url) rows; return ids of unknown tasks."""
+
     def list_users(self) -> list[dict[str, Any]]:
         """Return known users."""
 
@@ -90,9 +93,15 @@ class MeetingsRepositoryPort(Protocol):
     def get_user(self, user_id: str) -> dict[str, Any] | None:
         """Fetch user by ID."""
 
+    def get_users(self, ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Fetch several users at once, keyed by ID; unknown IDs are omitted."""
+
     def update_user_jira_account(self, user_id: str, account_id: str) -> None:
         """Store Jira account linkage."""
 
+    def update_user_jira_lookup_miss(self, user_id: str, missed_at: str) -> None:
+        """Record when a Jira account search last found no match for the user."""
+
     def create_meeting_stub(
             self,
             *,
@@ -135,7 +144,14 @@ class TelemetryPort(Protocol):
         """Emit telemetry for an extraction workflow."""
 
 
+class MeetingQueueFullError(RuntimeError):
+    """Raised by a bounded import queue that cannot accept more jobs right now."""
+
+
 @runtime_checkable
 class MeetingImportQueuePort(Protocol):
     async def enqueue(self, job: MeetingImportJob) -> None:
-        """Submit a meeting import task for background processing."""
+        """Submit a meeting import task for background processing.
+
+        Bounded queues raise MeetingQueueFullError instead of waiting for room.
+        """
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+SUPPORTED_AUDIO_EXTENSIONS: tuple[str, ...] = (".wav", ".mp3")
+
+
+def intro_audio_files(directory: Path, pattern: str) -> list[Path]:
+    """Return the intro samples in ``directory`` matching ``pattern``, sorted by name.
+
+    The default ``intro_*.*`` pattern also matches what sync_voices leaves beside each sample
+    (``.etag``, ``.part`` and pre-decoded ``.raw`` sidecars), so only supported audio files are kept.
+    """
+    if not directory.exists():
+        return []
+    return [
+        path
+        for path in sorted(directory.glob(pattern))
+        if path.suffix.lower() in SUPPORTED_AUDIO_EXTENSIONS and path.is_file()
+    ]
@@ -3,17 +3,34 @@ from __future__ import annotations
 import io
 import shutil
 import subprocess
-import wave
-from typing import Iterable, List, Tuple
+from pathlib import Path
+from typing import Iterator, Tuple
+
+import numpy as np
+
+try:  # pragma: no cover - optional dependency
+    import av
+except ImportError:  # pragma: no cover - ffmpeg subprocess is used instead
+    av = None
+
+try:  # pragma: no cover - optional dependency
+    import soxr
+except ImportError:  # pragma: no cover - libav's swresample is used instead
+    soxr = None
+
+PCM_SAMPLE_WIDTH = 2
 
 
 class FFmpegNotAvailableError(RuntimeError):
     """Raised when ffmpeg is missing from PATH."""
 
 
-def convert_to_standard_wav(content: bytes, *, sample_rate: int, channels: int) -> bytes:
-    """Normalize arbitrary audio bytes into mono WAV for Azure."""
+def convert_to_pcm(content: bytes, *, sample_rate: int, channels: int) -> bytes:
+    """Normalize arbitrary audio bytes into headerless little-endian 16-bit PCM via ffmpeg."""
+    return _run_ffmpeg(content, sample_rate=sample_rate, channels=channels, output_format="s16le")
+
 
+def _run_ffmpeg(content: bytes, *, sample_rate: int, channels: int, output_format: str) -> bytes:
     if shutil.which("ffmpeg") is None:
         raise FFmpegNotAvailableError("FFmpeg is required to handle audio but was not found in PATH")
 
@@ -28,7 +45,7 @@ def convert_to_standard_wav(content: bytes, *, sample_rate: int, channels: int)
             "-ar",
             str(sample_rate),
             "-f",
-            "wav",
+            output_format,
             "-acodec",
             "pcm_s16le",
             "pipe:1",
@@ -43,30 +60,81 @@ def convert_to_standard_wav(content: bytes, *, sample_rate: int, channels: int)
     return process.stdout
 
 
-def wav_payload(wav_bytes: bytes) -> Tuple[bytes, int, int, int, int]:
-    with wave.open(io.BytesIO(wav_bytes)) as wav_reader:
-        reported_frames = wav_reader.getnframes()
-        frames = wav_reader.readframes(reported_frames)
-        sample_rate = wav_reader.getframerate()
-        sample_width = wav_reader.getsampwidth()
-        channels = wav_reader.getnchannels()
-    bytes_per_frame = sample_width * channels
-    num_frames = len(frames) // bytes_per_frame if bytes_per_frame else 0
-    return frames, num_frames, sample_rate, sample_width, channels
+def decode_to_pcm(content: bytes, *, sample_rate: int, channels: int, use_ffmpeg: bool = False) -> Tuple[bytes, int]:
+    """Decode arbitrary audio bytes into interleaved 16-bit PCM frames and their frame count.
+
+    Decodes in-process with PyAV when it is installed; otherwise (or when ``use_ffmpeg`` is set)
+    falls back to the ffmpeg subprocess, asking it for raw s16le so there is no WAV container to parse.
+    """
+    bytes_per_frame = PCM_SAMPLE_WIDTH * channels
+    if av is None or use_ffmpeg:
+        pcm = convert_to_pcm(content, sample_rate=sample_rate, channels=channels)
+        return pcm, len(pcm) // bytes_per_frame
+
+    layout = "mono" if channels == 1 else "stereo"
+    if soxr is not None:
+        pcm = _decode_with_soxr(content, sample_rate=sample_rate, channels=channels, layout=layout)
+        return pcm, len(pcm) // bytes_per_frame
+
+    resampler = av.AudioResampler(format="s16", layout=layout, rate=sample_rate)
+    pcm = bytearray()
+    for resampled in _decoded_frames(content, resampler):
+        pcm += memoryview(resampled.planes[0])[: resampled.samples * bytes_per_frame]
+    return bytes(pcm), len(pcm) // bytes_per_frame
+
+
+def _decoded_frames(content: bytes, resampler) -> Iterator:
+    try:
+        with av.open(io.BytesIO(content)) as container:
+            for frame in container.decode(audio=0):
+                yield from resampler.resample(frame)
+            yield from resampler.resample(None)
+    except av.FFmpegError as exc:
+        raise RuntimeError(f"Failed to decode audio: {exc}") from exc
+
+
+def _decode_with_soxr(content: bytes, *, sample_rate: int, channels: int, layout: str) -> bytes:
+    """Decode to float at the source rate, then resample with soxr's vectorized polyphase filter."""
+    resampler = av.AudioResampler(format="flt", layout=layout)
+    blocks = []
+    source_rate = sample_rate
+    for resampled in _decoded_frames(content, resampler):
+        source_rate = resampled.sample_rate
+        blocks.append(resampled.to_ndarray().reshape(-1, channels))
+    if not blocks:
+        return b""
+    samples = np.concatenate(blocks)
+    if source_rate != sample_rate:
+        samples = soxr.resample(samples, source_rate, sample_rate, quality="HQ")
+    return np.clip(samples * 32767, -32768, 32767).astype("<i2").tobytes()
+
+
+def pcm_sidecar_path(path: Path, *, sample_rate: int, channels: int) -> Path:
+    """Where the pre-decoded 16-bit PCM of ``path`` is cached for the given output format."""
+    return path.with_name(f"{path.name}.{sample_rate}hz{channels}ch.s16.raw")
+
+
+def write_pcm_sidecar(path: Path, *, sample_rate: int, channels: int, use_ffmpeg: bool = False) -> Path:
+    """Decode ``path`` once and store its PCM beside it so later loads skip the decoder."""
+    frames, _ = decode_to_pcm(path.read_bytes(), sample_rate=sample_rate, channels=channels, use_ffmpeg=use_ffmpeg)
+    sidecar = pcm_sidecar_path(path, sample_rate=sample_rate, channels=channels)
+    tmp_path = sidecar.with_name(f"{sidecar.name}.part")
+    tmp_path.write_bytes(frames)
+    tmp_path.replace(sidecar)
+    return sidecar
+
+
+def read_pcm_sidecar(path: Path, *, sample_rate: int, channels: int) -> bytes | None:
+    """Return cached PCM for ``path``, or None when there is no sidecar or it predates the audio file."""
+    sidecar = pcm_sidecar_path(path, sample_rate=sample_rate, channels=channels)
+    try:
+        if sidecar.stat().st_mtime_ns < path.stat().st_mtime_ns:
+            return None
+        return sidecar.read_bytes()
+    except FileNotFoundError:
+        return None
 
 
 def frames_to_ticks(frame_index: int, sample_rate: int) -> int:
     seconds = frame_index / sample_rate
     return int(seconds * 10_000_000)
-
-
-def build_wav(frames_sequence: Iterable[bytes], sample_rate: int, sample_width: int, channels: int) -> bytes:
-    buffer = io.BytesIO()
-    with wave.open(buffer, "wb") as wav_writer:
-        wav_writer.setnchannels(channels)
-        wav_writer.setsampwidth(sample_width)
-        wav_writer.setframerate(sample_rate)
-        for chunk in frames_sequence:
-            wav_writer.writeframes(chunk)
-    buffer.seek(0)
-    return buffer.read()
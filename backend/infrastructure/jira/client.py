@@ -1,15 +1,54 @@
 from __future__ import annotations
 
 import base64
-import json
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
-from urllib import error, parse, request
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
 
 
 class JiraClientError(RuntimeError):
     """Raised when the Jira API rejects a request or cannot be reached."""
 
+    def __init__(self, message: str, *, status_code: int | None = None, body: str | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.body = body
+
+    @property
+    def is_client_error(self) -> bool:
+        return self.status_code is not None and 400 <= self.status_code < 500
+
+
+class _JiraRetry(Retry):
+    """Retry policy that never replays an issue-creating POST Jira may already have committed.
+
+    GETs are retried on transient 5xx responses and read errors. POSTs are retried only when Jira
+    refused the request outright (429 throttling, 503 unavailable) or the connection never opened.
+    A Retry-After longer than ``backoff_max`` is not waited out; the response is returned as the error.
+    """
+
+    POST_RETRY_STATUSES = frozenset({429, 503})
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return status_code in self.POST_RETRY_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None and self.respect_retry_after_header:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None and retry_after > self.backoff_max:
+                # Giving up lets urllib3 hand back the throttled response instead of blocking a push worker.
+                raise MaxRetryError(_pool, url, ResponseError(f"Retry-After of {retry_after:.0f}s exceeds the cap"))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
 
 @dataclass
 class JiraIssue:
@@ -20,6 +59,9 @@ class JiraIssue:
 class JiraClient:
     """Tiny Jira REST API adapter that creates backlog items from approved tasks."""
 
+    BULK_CREATE_LIMIT = 50
+    DEFAULT_POOL_MAXSIZE = 32
+
     def __init__(
             self,
             *,
@@ -29,6 +71,8 @@ class JiraClient:
             project_key: str,
             story_points_field: str | None = None,
             timeout: float = 20.0,
+            pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+            user_cache_size: int = 1024,
     ) -> None:
         if not base_url or not email or not api_token or not project_key:
             raise ValueError("Jira client requires base_url, email, api_token and project_key.")
@@ -37,76 +81,126 @@ class JiraClient:
         self._project_key = project_key
         self._story_points_field = story_points_field
         token = base64.b64encode(f"{email}:{api_token}".encode("utf-8")).decode("utf-8")
-        self._auth_header = f"Basic {token}"
+        self._base_headers = {
+            "Authorization": f"Basic {token}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
         self._timeout = timeout
+        self._session = self._build_session(pool_maxsize)
+        self._session.headers.update(self._base_headers)
+        self._user_cache: OrderedDict[str, str] = OrderedDict()
+        self._user_cache_size = user_cache_size
+        self._user_cache_lock = threading.Lock()
 
-    def create_issue(
-            self,
-            *,
-            summary: str,
-            description: str | None,
-            issue_type: str,
-            priority: str,
-            labels: list[str] | None,
-            assignee_account_id: str | None,
-            story_points: int | None,
-            source_quote: str | None,
-    ) -> JiraIssue:
-        payload = {
-            "fields": self._build_fields(
-                summary=summary,
-                description=description,
-                issue_type=issue_type,
-                priority=priority,
-                labels=labels,
-                assignee_account_id=assignee_account_id,
-                story_points=story_points,
-                source_quote=source_quote,
-            )
-        }
-        data = self._request("POST", "/issue", payload)
+    @staticmethod
+    def _build_session(pool_maxsize: int) -> requests.Session:
+        """Keep-alive session so TLS handshakes are shared across Jira calls.
+
+        Throttled (429) and unavailable (503) responses are retried after the Retry-After delay Jira
+        sends (up to ``backoff_max``), falling back to exponential backoff; the error is only raised
+        once retries run out or Jira asks for a longer wait.
+        Other 5xx responses and read errors are retried for GETs only, see ``_JiraRetry``.
+        """
+        retry = _JiraRetry(
+            total=5,
+            other=0,
+            backoff_factor=1.0,
+            backoff_max=60,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # All calls go to one Jira host, so a single pool sized for the push workers is enough; connections
+        # beyond pool_maxsize would be opened and thrown away, paying a fresh TLS handshake each time.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def create_issue(self, issue: dict[str, Any]) -> JiraIssue:
+        """Create one issue from a task payload.
+
+        The payload carries ``summary``, ``description``, ``issue_type``, ``priority``, ``labels``,
+        ``assignee_account_id``, ``story_points`` and ``source_quote``; only ``summary`` is required.
+        """
+        data = self._request("POST", "/issue", {"fields": self._build_fields(issue)})
         key = data.get("key")
         if not key:
             raise JiraClientError(f"Jira API response did not include an issue key: {data}")
-        issue_url = f"{self._base_url}/browse/{key}"
-        return JiraIssue(key=key, url=issue_url)
+        return self._issue(key)
 
-    def _build_fields(
-            self,
-            *,
-            summary: str,
-            description: str | None,
-            issue_type: str,
-            priority: str,
-            labels: list[str] | None,
-            assignee_account_id: str | None,
-            story_points: int | None,
-            source_quote: str | None,
-    ) -> dict[str, Any]:
-        summary_text = (summary or "").strip() or "Untitled task"
+    def bulk_create_issues(self, issues: list[dict[str, Any]]) -> list[JiraIssue | None]:
+        """Create up to ``BULK_CREATE_LIMIT`` issues in a single request.
+
+        Each item is a task payload as accepted by ``create_issue``. The result is aligned
+        with the input; elements Jira rejected are returned as ``None`` so callers can retry them.
+        """
+        if not issues:
+            return []
+        if len(issues) > self.BULK_CREATE_LIMIT:
+            raise ValueError(f"Jira bulk create accepts at most {self.BULK_CREATE_LIMIT} issues per request.")
+        payload = {"issueUpdates": [{"fields": self._build_fields(issue)} for issue in issues]}
+        try:
+            data = self._request("POST", "/issue/bulk", payload)
+        except JiraClientError as exc:
+            # Jira answers 400 when any element fails, but still creates the valid ones.
+            data = self._parse_bulk_failure(exc)
+        created = list(data.get("issues") or [])
+        failed = {
+            error.get("failedElementNumber")
+            for error in data.get("errors") or []
+            if isinstance(error, dict)
+        }
+        results: list[JiraIssue | None] = []
+        for index in range(len(issues)):
+            if index in failed or not created:
+                results.append(None)
+                continue
+            key = created.pop(0).get("key")
+            results.append(self._issue(key) if key else None)
+        return results
+
+    def _issue(self, key: str) -> JiraIssue:
+        return JiraIssue(key=key, url=f"{self._base_url}/browse/{key}")
+
+    @staticmethod
+    def _parse_bulk_failure(exc: JiraClientError) -> dict[str, Any]:
+        if exc.status_code != 400 or not exc.body:
+            raise exc
+        try:
+            data = orjson.loads(exc.body)
+        except ValueError:
+            raise exc from None
+        if not isinstance(data, dict) or "errors" not in data:
+            raise exc
+        return data
+
+    def _build_fields(self, issue: dict[str, Any]) -> dict[str, Any]:
+        summary_text = (issue.get("summary") or "").strip() or "Untitled task"
         fields: dict[str, Any] = {
             "summary": summary_text[:254],
             "project": {"key": self._project_key},
-            "issuetype": {"name": issue_type or "Task"},
-            "priority": {"name": priority or "Medium"},
+            "issuetype": {"name": issue.get("issue_type") or "Task"},
+            "priority": {"name": issue.get("priority") or "Medium"},
         }
-        description_body = self._build_description(description, source_quote)
+        description_body = self._build_description(issue.get("description"), issue.get("source_quote"))
         if description_body:
             fields["description"] = description_body
-        if labels:
+        if labels := issue.get("labels"):
             fields["labels"] = labels
-        if assignee_account_id:
+        if assignee_account_id := issue.get("assignee_account_id"):
             fields["assignee"] = {"accountId": assignee_account_id}
+        story_points = issue.get("story_points")
         if story_points is not None and self._story_points_field:
             fields[self._story_points_field] = story_points
         return fields
 
     def _build_description(self, description: str | None, source_quote: str | None) -> dict[str, Any] | None:
-        paragraphs = []
         text = (description or "").strip()
-        if text:
-            for block in text.splitlines():
-                paragraphs.append(self._paragraph(block))
+        paragraphs = [self._paragraph(block) for block in text.splitlines()]
         if source_quote:
             paragraphs.append(
                 {
@@ -122,38 +216,56 @@ class JiraClient:
 
     @staticmethod
     def _paragraph(text: str) -> dict[str, Any]:
-        content: list[dict[str, Any]] = []
         cleaned = text.strip()
-        if cleaned:
-            content.append({"type": "text", "text": cleaned})
-        return {"type": "paragraph", "content": content}
-
-    def _request(self, method: str, path: str, payload: dict[str, Any] | None) -> Any:
-        body = json.dumps(payload).encode("utf-8") if payload is not None else None
-        req = request.Request(
-            f"{self._api_base}{path}",
-            data=body,
-            headers={
-                "Authorization": self._auth_header,
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            },
-            method=method,
-        )
+        return {"type": "paragraph", "content": [{"type": "text", "text": cleaned}] if cleaned else []}
+
+    def _request(
+            self,
+            method: str,
+            path: str,
+            payload: dict[str, Any] | None,
+            *,
+            params: dict[str, Any] | None = None,
+    ) -> Any:
         try:
-            with request.urlopen(req, timeout=self._timeout) as resp:
-                data = resp.read().decode("utf-8")
-                return json.loads(data) if data else {}
-        except error.HTTPError as exc:
-            details = exc.read().decode("utf-8", errors="ignore")
-            message = details or exc.reason or f"HTTP {exc.code}"
-            raise JiraClientError(f"Jira API error: {message}") from exc
-        except error.URLError as exc:
-            raise JiraClientError(f"Failed to reach Jira: {exc.reason}") from exc
+            resp = self._session.request(
+                method,
+                f"{self._api_base}{path}",
+                data=orjson.dumps(payload) if payload is not None else None,
+                params=params,
+                timeout=self._timeout,
+            )
+        except requests.RequestException as exc:
+            raise JiraClientError(f"Failed to reach Jira: {exc}") from exc
+        try:
+            resp.raise_for_status()
+        except requests.HTTPError as exc:
+            details = resp.text
+            message = details or resp.reason or f"HTTP {resp.status_code}"
+            raise JiraClientError(
+                f"Jira API error: {message}", status_code=resp.status_code, body=details
+            ) from exc
+        return orjson.loads(resp.content) if resp.content else {}
 
     def find_user_account_id(self, display_name: str) -> str | None:
-        query = parse.urlencode({"query": display_name, "maxResults": 1})
-        data = self._request("GET", f"/user/search?{query}", None)
-        if isinstance(data, list) and data:
-            return data[0].get("accountId")
-        return None
+        key = display_name.strip().lower()
+        with self._user_cache_lock:
+            if key in self._user_cache:
+                self._user_cache.move_to_end(key)
+                return self._user_cache[key]
+        data = self._request("GET", "/user/search", None, params={"query": display_name, "maxResults": 1})
+        account_id = data[0].get("accountId") if isinstance(data, list) and data else None
+        if account_id is None:
+            # Misses are not cached here: callers persist them with a TTL, and a user created in Jira later
+            # must be found by the next lookup after that TTL, not only after a process restart.
+            return None
+        with self._user_cache_lock:
+            self._user_cache[key] = account_id
+            self._user_cache.move_to_end(key)
+            while len(self._user_cache) > self._user_cache_size:
+                self._user_cache.popitem(last=False)
+        return account_id
+
+    def clear_user_cache(self) -> None:
+        with self._user_cache_lock:
+            self._user_cache.clear()
@@ -1,18 +1,28 @@
-import json
+import asyncio
+import hashlib
+import io
 import logging
 import os
 import re
-from difflib import SequenceMatcher
+import tempfile
+from functools import cached_property
 from pathlib import Path
 from typing import Mapping, MutableMapping, Any
+import json_repair
+import orjson
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import AzureChatOpenAI, ChatOpenAI
 from pydantic import ValidationError
+from rapidfuzz import fuzz, process
 
+from backend.infrastructure.audio.intros import intro_audio_files
 from backend.schemas import ExtractionResult, Task
-
+
 logger = logging.getLogger(__name__)
 
+# Bump whenever the prompt or post-processing changes so cached extractions are not reused.
+PROMPT_VERSION = "1"
+
 
 def _extract_speakers_from_transcript(transcript: str) -> list[str]:
     """Extract speaker labels from diarized transcript lines.
@@ -52,13 +62,9 @@ def _known_voice_names(intro_dir: str | Path | None = None, pattern: str | None
     """Return names derived from intro_* files so we can map partial matches to full names."""
     directory = Path(intro_dir or os.getenv("INTRO_AUDIO_DIR", "data/voices"))
     glob_pattern = pattern or os.getenv("INTRO_AUDIO_PATTERN", "intro_*.*")
-    if not directory.exists():
-        return []
     names: list[str] = []
     seen: set[str] = set()
-    for path in sorted(directory.glob(glob_pattern)):
-        if not path.is_file():
-            continue
+    for path in intro_audio_files(directory, glob_pattern):
         name = _role_from_intro_filename(path)
         key = name.lower().strip()
         if key and key not in seen:
@@ -105,73 +111,98 @@ def _augment_with_known_voices(extracted: list[str]) -> list[str]:
     return resolved
 
 
+def _match_speakers(names: list[str], valid_speakers: list[str], threshold: float = 0.6) -> dict[str, str | None]:
+    """Resolve every name against the valid speakers with one batched rapidfuzz call.
+
+    WRatio also scores partial matches, so "Adrian" still resolves to "Adrian Puchacki".
+    Names whose best score stays below threshold map to None.
+    """
+    queries = list(dict.fromkeys(name for name in names if name))
+    if not queries or not valid_speakers:
+        return {name: None for name in queries}
+
+    scores = process.cdist(
+        [name.lower().strip() for name in queries],
+        [speaker.lower() for speaker in valid_speakers],
+        scorer=fuzz.WRatio,
+    )
+    best = scores.argmax(axis=1)
+    return {
+        name: valid_speakers[index] if scores[row, index] >= threshold * 100 else None
+        for row, (name, index) in enumerate(zip(queries, best))
+    }
+
+
 def _fuzzy_match_speaker(name: str, valid_speakers: list[str], threshold: float = 0.6) -> str | None:
     """Find the best matching speaker using fuzzy string matching.
 
     Returns the matched speaker name if similarity exceeds threshold, otherwise None.
     """
-    if not name or not valid_speakers:
-        return None
-
-    name_lower = name.lower().strip()
-    best_match = None
-    best_score = 0.0
-
-    for speaker in valid_speakers:
-        speaker_lower = speaker.lower()
-        # Exact match (case-insensitive)
-        if name_lower == speaker_lower:
-            return speaker
-
-        # Check if name is a substring (e.g., "Adrian" matches "Adrian Puchacki")
-        if name_lower in speaker_lower or speaker_lower in name_lower:
-            score = len(name_lower) / max(len(speaker_lower), 1)
-            if score > best_score:
-                best_score = score
-                best_match = speaker
-                continue
-
-        # Fuzzy matching
-        score = SequenceMatcher(None, name_lower, speaker_lower).ratio()
-        if score > best_score:
-            best_score = score
-            best_match = speaker
-
-    if best_score >= threshold:
-        return best_match
-    return None
-
-
-class LLMExtractor:
-    @staticmethod
-    def _llm_chain(transcript: str, valid_speakers: list[str] | None = None) -> ExtractionResult:
-        provider = os.getenv("LLM_PROVIDER", "azure").lower()
+    return _match_speakers([name], valid_speakers, threshold).get(name)
+
+
+class LLMExtractor:
+    # Schema instructions are identical for every call; only the speaker constraint varies.
+    _SYSTEM_PROMPT = (
+        "You are an Agile Product Owner. Extract Jira-ready tasks from meeting transcripts. "
+        "Return STRICT JSON following the schema:\n"
+        "{{\n  \"tasks\": [\n    {{\n      \"summary\": str, \"description\": str, "
+        "\"issue_type\": one of [\"Story\",\"Task\",\"Bug\",\"Spike\"], "
+        "\"assignee_name\": str|null, \"priority\": one of [\"Low\",\"Medium\",\"High\"], "
+        "\"story_points\": int|null, \"labels\": [str], \"links\": [str], \"quotes\": [str]\n    }}\n  ]\n}}"
+        "\nIf no assignee, set null. Use quotes to include short verbatim snippets from the transcript that justify each task."
+    )
+
+    @cached_property
+    def _llm(self):
+        """Chat client built on first use and reused for every extraction."""
+        return self._build_llm()
+
+    def _llm_chain(self, transcript: str, valid_speakers: list[str] | None = None) -> ExtractionResult:
         if valid_speakers is None:
             valid_speakers = _augment_with_known_voices(_extract_speakers_from_transcript(transcript))
+        llm = self._llm
+        messages = self._build_messages(transcript, valid_speakers)
+        raw_response = self._complete(llm, messages)
+        result = self._parse_or_repair_response(llm, raw_response)
+        return self._validate_assignees(result, valid_speakers)
 
+    async def _llm_chain_async(self, transcript: str, valid_speakers: list[str] | None = None) -> ExtractionResult:
+        if valid_speakers is None:
+            valid_speakers = _augment_with_known_voices(_extract_speakers_from_transcript(transcript))
+        llm = self._llm
+        messages = self._build_messages(transcript, valid_speakers)
+        raw_response = await self._acomplete(llm, messages)
+        result = await self._aparse_or_repair_response(llm, raw_response)
+        return self._validate_assignees(result, valid_speakers)
+
+    @staticmethod
+    def _build_llm():
+        provider = os.getenv("LLM_PROVIDER", "azure").lower()
         if provider == "azure":
             api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
             azure_deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT")
             azure_endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-
-            if not azure_deployment:
-                raise RuntimeError(
-                    "AZURE_OPENAI_DEPLOYMENT environment variable must be set to use Azure OpenAI."
-                )
-            if not azure_endpoint:
-                raise RuntimeError(
-                    "AZURE_OPENAI_ENDPOINT environment variable must be set to use Azure OpenAI."
-                )
-
-            llm = AzureChatOpenAI(
-                api_version=api_version,
-                azure_deployment=azure_deployment,
-                azure_endpoint=azure_endpoint,
-                temperature=0.1,
-            )
-        else:
-            llm = ChatOpenAI(model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"), temperature=0.1)
-
+
+            if not azure_deployment:
+                raise RuntimeError(
+                    "AZURE_OPENAI_DEPLOYMENT environment variable must be set to use Azure OpenAI."
+                )
+            if not azure_endpoint:
+                raise RuntimeError(
+                    "AZURE_OPENAI_ENDPOINT environment variable must be set to use Azure OpenAI."
+                )
+
+            return AzureChatOpenAI(
+                api_version=api_version,
+                azure_deployment=azure_deployment,
+                azure_endpoint=azure_endpoint,
+                temperature=0.1,
+            )
+        return ChatOpenAI(model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"), temperature=0.1)
+
+    @staticmethod
+    def _build_messages(transcript: str, valid_speakers: list[str] | None) -> list:
         # Build speaker constraint for the prompt
         speaker_constraint = ""
         if valid_speakers:
@@ -180,82 +211,120 @@ class LLMExtractor:
                 f"\n\nIMPORTANT: The only valid assignees are the identified speakers from the meeting: [{speaker_list}]. "
                 "assignee_name MUST be exactly one of these names or null. Do NOT use any other names."
             )
-
-        system = (
-            "You are an Agile Product Owner. Extract Jira-ready tasks from meeting transcripts. "
-            "Return STRICT JSON following the schema:\n"
-            "{{\n  \"tasks\": [\n    {{\n      \"summary\": str, \"description\": str, "
-            "\"issue_type\": one of [\"Story\",\"Task\",\"Bug\",\"Spike\"], "
-            "\"assignee_name\": str|null, \"priority\": one of [\"Low\",\"Medium\",\"High\"], "
-            "\"story_points\": int|null, \"labels\": [str], \"links\": [str], \"quotes\": [str]\n    }}\n  ]\n}}"
-            "\nIf no assignee, set null. Use quotes to include short verbatim snippets from the transcript that justify each task."
-            f"{speaker_constraint}"
-        )
-        human = f"Transcript:\n{transcript}\n---\nReturn only JSON, no prose."
-        messages = [SystemMessage(content=system), HumanMessage(content=human)]
-
-        raw_response = llm.invoke(messages).content
-        result = LLMExtractor._parse_or_repair_response(llm, raw_response)
-        return LLMExtractor._validate_assignees(result, valid_speakers)
-
-    @staticmethod
+
+        system = LLMExtractor._SYSTEM_PROMPT + speaker_constraint
+        human = f"Transcript:\n{transcript}\n---\nReturn only JSON, no prose."
+        return [SystemMessage(content=system), HumanMessage(content=human)]
+
+    @staticmethod
+    def _complete(llm, messages) -> str:
+        """Stream the completion and join the text deltas as they arrive."""
+        buffer = io.StringIO()
+        for chunk in llm.stream(messages):
+            if isinstance(chunk.content, str):
+                buffer.write(chunk.content)
+        return buffer.getvalue()
+
+    @staticmethod
+    async def _acomplete(llm, messages) -> str:
+        buffer = io.StringIO()
+        async for chunk in llm.astream(messages):
+            if isinstance(chunk.content, str):
+                buffer.write(chunk.content)
+        return buffer.getvalue()
+
+    @staticmethod
     def _validate_assignees(result: ExtractionResult, valid_speakers: list[str] | None) -> ExtractionResult:
         """Ensure all assignee_name values are valid speakers or set to None."""
         if not valid_speakers:
             return result
 
-        for task in result.tasks:
-            if task.assignee_name:
-                matched = _fuzzy_match_speaker(task.assignee_name, valid_speakers)
-                if matched:
-                    task.assignee_name = matched
-                else:
-                    logger.warning(
-                        "Assignee '%s' not found in valid speakers %s, setting to None",
-                        task.assignee_name,
-                        valid_speakers,
+        matches = _match_speakers([task.assignee_name for task in result.tasks], valid_speakers)
+        for task in result.tasks:
+            if task.assignee_name:
+                matched = matches[task.assignee_name]
+                if matched:
+                    task.assignee_name = matched
+                else:
+                    logger.warning(
+                        "Assignee '%s' not found in valid speakers %s, setting to None",
+                        task.assignee_name,
+                        valid_speakers,
                     )
                     task.assignee_name = None
         return result
-
-    @staticmethod
+
+    @staticmethod
     def _parse_or_repair_response(llm, payload: str) -> ExtractionResult:
         try:
-            data = json.loads(payload)
+            data = orjson.loads(payload)
+            return ExtractionResult.model_validate(data)
+        except (orjson.JSONDecodeError, ValidationError) as exc:
+            logger.warning("LLM payload failed validation. Attempting salvage/repair.", exc_info=exc)
+            salvaged = LLMExtractor._salvage_tasks(payload) or LLMExtractor._repair_locally(payload)
+            if salvaged:
+                return salvaged
+            logger.warning("Local JSON repair failed; asking the LLM to repair the payload.")
+            repaired = LLMExtractor._complete(llm, LLMExtractor._repair_messages(payload, exc))
+            data = orjson.loads(repaired)
+            return ExtractionResult.model_validate(data)
+
+    @staticmethod
+    async def _aparse_or_repair_response(llm, payload: str) -> ExtractionResult:
+        try:
+            data = orjson.loads(payload)
             return ExtractionResult.model_validate(data)
-        except (json.JSONDecodeError, ValidationError) as exc:
+        except (orjson.JSONDecodeError, ValidationError) as exc:
             logger.warning("LLM payload failed validation. Attempting salvage/repair.", exc_info=exc)
-            salvaged = LLMExtractor._salvage_tasks(payload)
+            salvaged = LLMExtractor._salvage_tasks(payload) or LLMExtractor._repair_locally(payload)
             if salvaged:
                 return salvaged
-            repair_messages = [
-                SystemMessage(
-                    content=(
-                        "You repair JSON to satisfy a strict Pydantic schema. "
-                        "Return valid JSON only, no prose."
-                    )
-                ),
-                HumanMessage(
-                    content=(
-                        "Original completion:\n```"
-                        f"{payload}"
-                        "```"
-                        "\nValidation error:\n```"
-                        f"{exc}"
-                        "```"
-                        "\nReturn JSON matching the schema that passes validation."
-                    )
-                ),
-            ]
-            repaired = llm.invoke(repair_messages).content
-            data = json.loads(repaired)
+            logger.warning("Local JSON repair failed; asking the LLM to repair the payload.")
+            repaired = await LLMExtractor._acomplete(llm, LLMExtractor._repair_messages(payload, exc))
+            data = orjson.loads(repaired)
             return ExtractionResult.model_validate(data)
 
+    @staticmethod
+    def _repair_locally(payload: str) -> ExtractionResult | None:
+        """Fix common syntax slips (trailing commas, wrapping prose) without another LLM round trip."""
+        data = json_repair.loads(payload)
+        if not isinstance(data, Mapping):
+            return None
+        try:
+            result = ExtractionResult.model_validate(data)
+        except ValidationError:
+            result = LLMExtractor._salvage_tasks(data)
+        if result:
+            logger.warning("LLM payload was malformed JSON; repaired locally.")
+        return result
+
+    @staticmethod
+    def _repair_messages(payload: str, exc: Exception) -> list:
+        return [
+            SystemMessage(
+                content=(
+                    "You repair JSON to satisfy a strict Pydantic schema. "
+                    "Return valid JSON only, no prose."
+                )
+            ),
+            HumanMessage(
+                content=(
+                    "Original completion:\n```"
+                    f"{payload}"
+                    "```"
+                    "\nValidation error:\n```"
+                    f"{exc}"
+                    "```"
+                    "\nReturn JSON matching the schema that passes validation."
+                )
+            ),
+        ]
+
     @staticmethod
     def _salvage_tasks(payload: str | Mapping[str, Any]) -> ExtractionResult | None:
         """Best-effort recovery: keep all individually valid tasks even if the whole payload failed."""
         try:
-            data = json.loads(payload) if isinstance(payload, str) else payload
+            data = orjson.loads(payload) if isinstance(payload, str) else payload
         except Exception:
             return None
         if not isinstance(data, Mapping):
@@ -278,6 +347,75 @@ class LLMExtractor:
             except ValidationError:
                 continue
         return ExtractionResult(tasks=valid_tasks) if valid_tasks else None
-
+
+    @staticmethod
+    def _cache_dir() -> Path | None:
+        if os.getenv("LLM_CACHE_ENABLED", "").lower() not in {"1", "true", "yes", "on"}:
+            return None
+        return Path(os.getenv("LLM_CACHE_DIR", "data/llm_cache"))
+
+    @staticmethod
+    def _model_name() -> str:
+        if os.getenv("LLM_PROVIDER", "azure").lower() == "azure":
+            return f"azure:{os.getenv('AZURE_OPENAI_DEPLOYMENT', '')}"
+        return f"openai:{os.getenv('OPENAI_MODEL', 'gpt-4o-mini')}"
+
+    def _cache_path(self, transcript: str, valid_speakers: list[str]) -> Path | None:
+        directory = self._cache_dir()
+        if directory is None:
+            return None
+        raw_key = "|".join([self._model_name(), PROMPT_VERSION, *valid_speakers, transcript])
+        return directory / f"{hashlib.sha256(raw_key.encode('utf-8')).hexdigest()}.json"
+
+    @staticmethod
+    def _read_cache(path: Path | None) -> ExtractionResult | None:
+        if path is None or not path.is_file():
+            return None
+        try:
+            return ExtractionResult.model_validate_json(path.read_text(encoding="utf-8"))
+        except (OSError, ValidationError):
+            logger.warning("Ignoring unreadable LLM cache entry %s", path)
+            return None
+
+    @staticmethod
+    def _write_cache(path: Path | None, result: ExtractionResult) -> None:
+        if path is None:
+            return
+        tmp_path: Path | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temp name per writer, since threads and processes may store the same entry at once.
+            with tempfile.NamedTemporaryFile(
+                    "w", encoding="utf-8", dir=path.parent, prefix=f"{path.stem}.", suffix=".tmp", delete=False
+            ) as tmp_file:
+                tmp_path = Path(tmp_file.name)
+                tmp_file.write(result.model_dump_json())
+            tmp_path.replace(path)
+        except OSError:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            logger.warning("Failed to write LLM cache entry %s", path, exc_info=True)
+
     def extract(self, transcript: str) -> ExtractionResult:
-        return self._llm_chain(transcript)
+        valid_speakers = _augment_with_known_voices(_extract_speakers_from_transcript(transcript))
+        cache_path = self._cache_path(transcript, valid_speakers)
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            return cached
+        result = self._llm_chain(transcript, valid_speakers)
+        self._write_cache(cache_path, result)
+        return result
+
+    async def aextract(self, transcript: str) -> ExtractionResult:
+        valid_speakers = _augment_with_known_voices(_extract_speakers_from_transcript(transcript))
+        cache_path = self._cache_path(transcript, valid_speakers)
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            return cached
+        result = await self._llm_chain_async(transcript, valid_speakers)
+        self._write_cache(cache_path, result)
+        return result
+
+    async def aextract_many(self, transcripts: list[str]) -> list[ExtractionResult]:
+        """Extract several transcripts with overlapping LLM calls."""
+        return list(await asyncio.gather(*(self.aextract(transcript) for transcript in transcripts)))
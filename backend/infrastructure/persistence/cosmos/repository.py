@@ -11,6 +11,10 @@ from backend.domain.status import MeetingStatus
 from backend.schemas import ExtractionResult
 
 
+# Cosmos transactional batches hold at most 100 operations, all within one partition key.
+COSMOS_BATCH_LIMIT = 100
+
+
 def utc_now_iso() -> str:
     return datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
 
@@ -249,33 +253,50 @@ class CosmosMeetingsRepository(MeetingsRepositoryPort):
         return updated
 
     def get_tasks_by_ids(self, ids: Iterable[str]) -> list[dict[str, Any]]:
-        self._audit("get_tasks_by_ids", resource="task", details={"ids": list(ids)})
-        found: list[dict[str, Any]] = []
-        unique_ids = {task_id for task_id in ids if task_id}
+        unique_ids = list(dict.fromkeys(task_id for task_id in ids if task_id))
+        self._audit("get_tasks_by_ids", resource="task", details={"ids": unique_ids})
         if not unique_ids:
             return []
-        for task_id in unique_ids:
-            task = self.get_task(task_id)
-            if task:
-                found.append(task)
-        return found
+        items = self._query_tasks_by_ids(unique_ids)
+        assignee_map = self._load_users({item.get("assigneeId") for item in items if item.get("assigneeId")})
+        return [self._serialize_task(item, assignee_map) for item in items]
 
     def mark_task_pushed_to_jira(self, task_id: str, *, issue_key: str, issue_url: str | None) -> None:
+        if self.mark_tasks_pushed_to_jira([(task_id, issue_key, issue_url)]):
+            raise ValueError("Task not found")
+
+    def mark_tasks_pushed_to_jira(self, rows: Iterable[tuple[str, str, str | None]]) -> list[str]:
+        rows = list(rows)
         self._audit(
-            "mark_task_pushed_to_jira",
+            "mark_tasks_pushed_to_jira",
             resource="task",
-            details={"task_id": task_id, "issue_key": issue_key, "issue_url": issue_url},
+            details={"issues": {task_id: issue_key for task_id, issue_key, _ in rows}},
         )
-        task = self.get_task(task_id)
-        if not task:
-            raise ValueError("Task not found")
-        doc = self._tasks.read_item(task_id, partition_key=task["meetingId"])
-        doc["status"] = "approved"
-        doc["jiraIssueKey"] = issue_key
-        doc["jiraIssueUrl"] = issue_url
-        doc["pushedToJiraAt"] = utc_now_iso()
-        doc["updatedAt"] = doc["pushedToJiraAt"]
-        self._tasks.upsert_item(doc)
+        if not rows:
+            return []
+        docs = {doc["id"]: doc for doc in self._query_tasks_by_ids([task_id for task_id, _, _ in rows])}
+        now = utc_now_iso()
+        missing: list[str] = []
+        by_meeting: dict[str, list[dict[str, Any]]] = {}
+        for task_id, issue_key, issue_url in rows:
+            doc = docs.get(task_id)
+            if doc is None:
+                missing.append(task_id)
+                continue
+            doc["status"] = "approved"
+            doc["jiraIssueKey"] = issue_key
+            doc["jiraIssueUrl"] = issue_url
+            doc["pushedToJiraAt"] = now
+            doc["updatedAt"] = now
+            by_meeting.setdefault(doc["meetingId"], []).append(doc)
+        # One round trip per meeting partition (and per 100 tasks) instead of one per task.
+        for meeting_id, meeting_docs in by_meeting.items():
+            for start in range(0, len(meeting_docs), COSMOS_BATCH_LIMIT):
+                self._tasks.execute_item_batch(
+                    [("upsert", (doc,)) for doc in meeting_docs[start:start + COSMOS_BATCH_LIMIT]],
+                    partition_key=meeting_id,
+                )
+        return missing
 
     def list_users(self) -> list[dict[str, Any]]:
         users = list(self._users.read_all_items())
@@ -298,15 +319,34 @@ class CosmosMeetingsRepository(MeetingsRepositoryPort):
                 "displayName": doc.get("displayName"),
                 "email": doc.get("email"),
                 "jiraAccountId": doc.get("jiraAccountId"),
+                "jiraLookupMissAt": doc.get("jiraLookupMissAt"),
             }
         except exceptions.CosmosResourceNotFoundError:
             return None
 
+    def get_users(self, ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        docs = self._load_users(set(ids))
+        return {
+            user_id: {
+                "id": doc["id"],
+                "displayName": doc.get("displayName"),
+                "email": doc.get("email"),
+                "jiraAccountId": doc.get("jiraAccountId"),
+                "jiraLookupMissAt": doc.get("jiraLookupMissAt"),
+            }
+            for user_id, doc in docs.items()
+        }
+
     def update_user_jira_account(self, user_id: str, account_id: str) -> None:
         doc = self._users.read_item(item=user_id, partition_key=user_id)
         doc["jiraAccountId"] = account_id
         self._users.upsert_item(doc)
 
+    def update_user_jira_lookup_miss(self, user_id: str, missed_at: str) -> None:
+        doc = self._users.read_item(item=user_id, partition_key=user_id)
+        doc["jiraLookupMissAt"] = missed_at
+        self._users.upsert_item(doc)
+
     # --- Ports implementation -------------------------------------------
 
     def create_meeting_stub(
@@ -482,17 +522,31 @@ class CosmosMeetingsRepository(MeetingsRepositoryPort):
             "pushedToJiraAt": item.get("pushedToJiraAt"),
         }
 
+    def _query_tasks_by_ids(self, task_ids: list[str]) -> list[dict[str, Any]]:
+        return list(
+            self._tasks.query_items(
+                query="SELECT * FROM c WHERE ARRAY_CONTAINS(@ids, c.id)",
+                parameters=[{"name": "@ids", "value": task_ids}],
+                enable_cross_partition_query=True,
+            )
+        )
+
     def _load_users(self, user_ids: set[str | None]) -> dict[str, dict[str, Any]]:
-        result: dict[str, dict[str, Any]] = {}
-        for user_id in user_ids:
-            if not user_id:
-                continue
+        ids = [user_id for user_id in user_ids if user_id]
+        if not ids:
+            return {}
+        if len(ids) == 1:
+            # A point read is the cheapest lookup for a single user.
             try:
-                doc = self._users.read_item(item=user_id, partition_key=user_id)
-                result[user_id] = doc
+                return {ids[0]: self._users.read_item(item=ids[0], partition_key=ids[0])}
             except exceptions.CosmosResourceNotFoundError:
-                continue
-        return result
+                return {}
+        docs = self._users.query_items(
+            query="SELECT * FROM c WHERE ARRAY_CONTAINS(@ids, c.id)",
+            parameters=[{"name": "@ids", "value": ids}],
+            enable_cross_partition_query=True,
+        )
+        return {doc["id"]: doc for doc in docs}
 
     def _delete_tasks_for_meeting(self, meeting_id: str) -> None:
         query = "SELECT c.id FROM c WHERE c.meetingId = @meetingId"
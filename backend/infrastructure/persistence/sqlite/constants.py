@@ -3,6 +3,26 @@ from __future__ import annotations
 import os
 
 DEFAULT_DB_URL = os.getenv("DB_URL", "sqlite:///./app.db")
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER (999 on older builds) for IN (...) lookups.
+MAX_QUERY_PARAMS = 500
+
+# Fixed column order for positional task reads; mappers.serialize_task_row_* unpack rows in this order.
+TASK_COLUMNS = (
+    "id",
+    "meeting_id",
+    "summary",
+    "description",
+    "issue_type",
+    "priority",
+    "story_points",
+    "assignee_id",
+    "labels",
+    "status",
+    "source_quote",
+    "jira_issue_key",
+    "jira_issue_url",
+    "pushed_to_jira_at",
+)
 
 TASK_STATUSES = ("draft", "approved", "rejected")
 ISSUE_TYPES = ("Story", "Task", "Bug", "Spike")
@@ -93,6 +93,7 @@ def _init_schema(conn: sqlite3.Connection) -> None:
             display_name TEXT NOT NULL,
             email TEXT,
             jira_account_id TEXT,
+            jira_lookup_miss_at TEXT,
             voice_sample_path TEXT
         )
         """
@@ -103,6 +104,7 @@ def _init_schema(conn: sqlite3.Connection) -> None:
     _ensure_column(conn, "tasks", "pushed_to_jira_at", "TEXT")
     _ensure_column(conn, "users", "jira_account_id", "TEXT")
     _ensure_column(conn, "users", "voice_sample_path", "TEXT")
+    _ensure_column(conn, "users", "jira_lookup_miss_at", "TEXT")
     conn.commit()
 
 
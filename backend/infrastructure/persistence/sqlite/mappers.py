@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
 import sqlite3
 from typing import Any
 
+import orjson
+
 
 def serialize_meeting_row(row: sqlite3.Row) -> dict[str, Any]:
     started = row["started_at"] or row["created_at"]
@@ -16,32 +17,59 @@ def serialize_meeting_row(row: sqlite3.Row) -> dict[str, Any]:
     }
 
 
-def serialize_task_row(row: sqlite3.Row) -> dict[str, Any]:
-    labels = json.loads(row["labels"]) if row["labels"] else []
-    keys = set(row.keys()) if hasattr(row, "keys") else set()
-    assignee_account = None
-    if "assignee_jira_account_id" in keys:
-        assignee_account = row["assignee_jira_account_id"]
-    elif "jira_account_id" in keys:
-        assignee_account = row["jira_account_id"]
-    assignee_name = None
-    if "assignee_display_name" in keys:
-        assignee_name = row["assignee_display_name"]
+def serialize_user_row(row: sqlite3.Row) -> dict[str, Any]:
     return {
         "id": row["id"],
-        "meetingId": row["meeting_id"],
-        "summary": row["summary"],
-        "description": row["description"] or "",
-        "issueType": row["issue_type"],
-        "priority": row["priority"],
-        "storyPoints": row["story_points"],
-        "assigneeId": row["assignee_id"],
+        "displayName": row["display_name"],
+        "email": row["email"],
+        "jiraAccountId": row["jira_account_id"],
+        "jiraLookupMissAt": row["jira_lookup_miss_at"],
+    }
+
+
+def serialize_task_row_basic(row: tuple[Any, ...]) -> dict[str, Any]:
+    """Serialize a positional row selected as ``constants.TASK_COLUMNS``."""
+    return _task_dict(*row, None, None)
+
+
+def serialize_task_row_full(row: tuple[Any, ...]) -> dict[str, Any]:
+    """Serialize a positional row of ``constants.TASK_COLUMNS`` + assignee account id + assignee name."""
+    return _task_dict(*row)
+
+
+def _task_dict(
+        task_id: str,
+        meeting_id: str,
+        summary: str,
+        description: str | None,
+        issue_type: str,
+        priority: str,
+        story_points: int | None,
+        assignee_id: str | None,
+        labels: str | None,
+        status: str,
+        source_quote: str | None,
+        jira_issue_key: str | None,
+        jira_issue_url: str | None,
+        pushed_to_jira_at: str | None,
+        assignee_account: str | None,
+        assignee_name: str | None,
+) -> dict[str, Any]:
+    return {
+        "id": task_id,
+        "meetingId": meeting_id,
+        "summary": summary,
+        "description": description or "",
+        "issueType": issue_type,
+        "priority": priority,
+        "storyPoints": story_points,
+        "assigneeId": assignee_id,
         "assigneeName": assignee_name,
         "assigneeAccountId": assignee_account,
-        "labels": labels,
-        "status": row["status"],
-        "sourceQuote": row["source_quote"],
-        "jiraIssueKey": row["jira_issue_key"] if "jira_issue_key" in keys else None,
-        "jiraIssueUrl": row["jira_issue_url"] if "jira_issue_url" in keys else None,
-        "pushedToJiraAt": row["pushed_to_jira_at"] if "pushed_to_jira_at" in keys else None,
+        "labels": orjson.loads(labels) if labels else [],
+        "status": status,
+        "sourceQuote": source_quote,
+        "jiraIssueKey": jira_issue_key,
+        "jiraIssueUrl": jira_issue_url,
+        "pushedToJiraAt": pushed_to_jira_at,
     }
@@ -10,9 +10,19 @@ from backend.domain.ports import MeetingsRepositoryPort
 from backend.domain.status import MeetingStatus
 from backend.schemas import ExtractionResult
 from . import mappers
-from .constants import ISSUE_TYPES, PRIORITIES, TASK_STATUSES
+from .constants import ISSUE_TYPES, MAX_QUERY_PARAMS, PRIORITIES, TASK_COLUMNS, TASK_STATUSES
 from .database import SqliteDatabase, utc_now_iso
 
+_TASK_SELECT = ", ".join(TASK_COLUMNS)
+_TASK_SELECT_JOINED = ", ".join(f"t.{column}" for column in TASK_COLUMNS)
+
+
+def _tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Cursor yielding plain tuples, read positionally by the task serializers."""
+    cur = conn.cursor()
+    cur.row_factory = None
+    return cur
+
 
 class SqliteMeetingsRepository(MeetingsRepositoryPort):
     """SQLite-backed repository providing CRUD helpers for meetings and tasks."""
@@ -171,7 +181,7 @@ class SqliteMeetingsRepository(MeetingsRepositoryPort):
         self._audit("list_tasks", meeting_id=meeting_id, resource="task", details={"status": status})
         conn = self._db.connect()
         try:
-            query = "SELECT * FROM tasks"
+            query = f"SELECT {_TASK_SELECT} FROM tasks"
             clauses = []
             params: list[Any] = []
             if meeting_id:
@@ -183,8 +193,8 @@ class SqliteMeetingsRepository(MeetingsRepositoryPort):
             if clauses:
                 query += " WHERE " + " AND ".join(clauses)
             query += " ORDER BY created_at DESC"
-            rows = conn.execute(query, params).fetchall()
-            return [mappers.serialize_task_row(row) for row in rows]
+            rows = _tuple_cursor(conn).execute(query, params).fetchall()
+            return [mappers.serialize_task_row_basic(row) for row in rows]
         finally:
             conn.close()
 
@@ -192,8 +202,8 @@ class SqliteMeetingsRepository(MeetingsRepositoryPort):
         self._audit("get_task", resource="task", details={"task_id": task_id})
         conn = self._db.connect()
         try:
-            row = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
-            return mappers.serialize_task_row(row) if row else None
+            row = _tuple_cursor(conn).execute(f"SELECT {_TASK_SELECT} FROM tasks WHERE id = ?", (task_id,)).fetchone()
+            return mappers.serialize_task_row_basic(row) if row else None
         finally:
             conn.close()
 
@@ -270,55 +280,72 @@ class SqliteMeetingsRepository(MeetingsRepositoryPort):
         return updated_count
 
     def get_tasks_by_ids(self, ids: Iterable[str]) -> list[dict[str, Any]]:
-        task_ids = [task_id for task_id in ids if task_id]
+        task_ids = list(dict.fromkeys(task_id for task_id in ids if task_id))
         self._audit("get_tasks_by_ids", resource="task", details={"ids": task_ids})
         if not task_ids:
             return []
-        placeholders = ",".join("?" for _ in task_ids)
         conn = self._db.connect()
         try:
-            rows = conn.execute(
-                f"""
-                SELECT
-                    t.*,
-                    u.jira_account_id AS assignee_jira_account_id,
-                    u.display_name AS assignee_display_name
-                FROM tasks t
-                LEFT JOIN users u ON u.id = t.assignee_id
-                WHERE t.id IN ({placeholders})
-                """,
-                task_ids,
-            ).fetchall()
-            return [mappers.serialize_task_row(row) for row in rows]
+            cur = _tuple_cursor(conn)
+            rows: list[tuple[Any, ...]] = []
+            for start in range(0, len(task_ids), MAX_QUERY_PARAMS):
+                chunk = task_ids[start:start + MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" for _ in chunk)
+                rows.extend(
+                    cur.execute(
+                        f"""
+                        SELECT
+                            {_TASK_SELECT_JOINED},
+                            u.jira_account_id AS assignee_jira_account_id,
+                            u.display_name AS assignee_display_name
+                        FROM tasks t
+                        LEFT JOIN users u ON u.id = t.assignee_id
+                        WHERE t.id IN ({placeholders})
+                        """,
+                        chunk,
+                    ).fetchall()
+                )
+            return [mappers.serialize_task_row_full(row) for row in rows]
         finally:
             conn.close()
 
     def mark_task_pushed_to_jira(self, task_id: str, *, issue_key: str, issue_url: str | None) -> None:
+        if self.mark_tasks_pushed_to_jira([(task_id, issue_key, issue_url)]):
+            raise ValueError("Task not found")
+
+    def mark_tasks_pushed_to_jira(self, rows: Iterable[tuple[str, str, str | None]]) -> list[str]:
+        rows = list(rows)
         self._audit(
-            "mark_task_pushed_to_jira",
+            "mark_tasks_pushed_to_jira",
             resource="task",
-            details={"task_id": task_id, "issue_key": issue_key, "issue_url": issue_url},
+            details={"issues": {task_id: issue_key for task_id, issue_key, _ in rows}},
         )
+        if not rows:
+            return []
         now = utc_now_iso()
+        missing: list[str] = []
         conn = self._db.connect()
         try:
-            cur = conn.execute(
-                """
-                UPDATE tasks
-                SET status = 'approved',
-                    jira_issue_key = ?,
-                    jira_issue_url = ?,
-                    pushed_to_jira_at = ?,
-                    updated_at = ?
-                WHERE id = ?
-                """,
-                (issue_key, issue_url, now, now, task_id),
-            )
-            if cur.rowcount == 0:
-                raise ValueError("Task not found")
+            # Per-row updates in one transaction so tasks deleted meanwhile can be reported by id.
+            for task_id, issue_key, issue_url in rows:
+                cur = conn.execute(
+                    """
+                    UPDATE tasks
+                    SET status = 'approved',
+                        jira_issue_key = ?,
+                        jira_issue_url = ?,
+                        pushed_to_jira_at = ?,
+                        updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (issue_key, issue_url, now, now, task_id),
+                )
+                if cur.rowcount == 0:
+                    missing.append(task_id)
             conn.commit()
         finally:
             conn.close()
+        return missing
 
     def list_users(self) -> list[dict[str, Any]]:
         conn = self._db.connect()
@@ -343,17 +370,32 @@ class SqliteMeetingsRepository(MeetingsRepositoryPort):
         conn = self._db.connect()
         try:
             row = conn.execute(
-                "SELECT id, display_name, email, jira_account_id FROM users WHERE id = ?",
+                "SELECT id, display_name, email, jira_account_id, jira_lookup_miss_at FROM users WHERE id = ?",
                 (user_id,),
             ).fetchone()
             if not row:
                 return None
-            return {
-                "id": row["id"],
-                "displayName": row["display_name"],
-                "email": row["email"],
-                "jiraAccountId": row["jira_account_id"],
-            }
+            return mappers.serialize_user_row(row)
+        finally:
+            conn.close()
+
+    def get_users(self, ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        user_ids = list({user_id for user_id in ids if user_id})
+        if not user_ids:
+            return {}
+        conn = self._db.connect()
+        try:
+            users: dict[str, dict[str, Any]] = {}
+            for start in range(0, len(user_ids), MAX_QUERY_PARAMS):
+                chunk = user_ids[start:start + MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = conn.execute(
+                    "SELECT id, display_name, email, jira_account_id, jira_lookup_miss_at "
+                    f"FROM users WHERE id IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                users.update((row["id"], mappers.serialize_user_row(row)) for row in rows)
+            return users
         finally:
             conn.close()
 
@@ -368,6 +410,17 @@ class SqliteMeetingsRepository(MeetingsRepositoryPort):
         finally:
             conn.close()
 
+    def update_user_jira_lookup_miss(self, user_id: str, missed_at: str) -> None:
+        conn = self._db.connect()
+        try:
+            conn.execute(
+                "UPDATE users SET jira_lookup_miss_at = ? WHERE id = ?",
+                (missed_at, user_id),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
     # --- Ports implementation -------------------------------------------
     def create_meeting_stub(
             self,
@@ -15,6 +15,8 @@ from backend.domain.ports import MeetingImportQueuePort
 
 logger = logging.getLogger(__name__)
 
+AZURE_QUEUE_RECEIVE_LIMIT = 32
+
 
 def _ensure_queue_client(connection_string: str, queue_name: str) -> QueueClient:
     service_client = QueueServiceClient.from_connection_string(connection_string)
@@ -68,12 +70,16 @@ class AzureQueueWorker:
             visibility_timeout: int = 300,
             poll_interval_seconds: float = 2.0,
             max_batch_size: int = 16,
+            sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
     ) -> None:
         self._queue_client = queue_client
         self._handler = handler
         self._visibility_timeout = visibility_timeout
         self._poll_interval = poll_interval_seconds
-        self._max_batch_size = max_batch_size
+        # Azure returns at most 32 messages per receive; prefetch exactly one batch.
+        self._max_batch_size = max(1, min(max_batch_size, AZURE_QUEUE_RECEIVE_LIMIT))
+        # Injectable so tests can drive polling and visibility renewal without waiting on the wall clock.
+        self._sleep = sleep
         self._running = False
 
     async def run_forever(self) -> None:
@@ -83,25 +89,33 @@ class AzureQueueWorker:
                 lambda: list(
                     self._queue_client.receive_messages(
                         messages_per_page=self._max_batch_size,
+                        max_messages=self._max_batch_size,
                         visibility_timeout=self._visibility_timeout,
                     )
                 )
             )
             if not messages:
-                await asyncio.sleep(self._poll_interval)
+                await self._sleep(self._poll_interval)
                 continue
+            # Deletes run in the background while the rest of the batch is handled and are awaited
+            # once per batch; failed jobs are never acked and become visible again on their own.
+            acks: list[asyncio.Task[None]] = []
             for message in messages:
-                await self._process_message(message)
-
-    async def _process_message(self, message: Any) -> None:
+                job_id = await self._process_message(message)
+                if job_id is not None:
+                    acks.append(asyncio.create_task(self._delete_message(message, job_id)))
+            if acks:
+                await asyncio.gather(*acks)
+
+    async def _process_message(self, message: Any) -> str | None:
+        """Handle one message; returns a label for the message to acknowledge, or ``None`` to leave it."""
         renewal_task: asyncio.Task[None] | None = None
         try:
             job_data = json.loads(message.content)
             job = MeetingImportJob(**job_data)
         except Exception:  # pragma: no cover - safety net
             logger.exception("Invalid queue payload; deleting message")
-            await asyncio.to_thread(self._queue_client.delete_message, message.id, message.pop_receipt)
-            return
+            return f"<invalid message {message.id}>"
 
         if self._visibility_timeout:
             renewal_task = asyncio.create_task(self._renew_visibility(message))
@@ -110,22 +124,23 @@ class AzureQueueWorker:
             await self._handler(job)
         except Exception:
             logger.exception("Meeting import job failed for %s; message will become visible again", job.meeting_id)
+            return None
         else:
-            try:
-                await asyncio.to_thread(self._queue_client.delete_message, message.id, message.pop_receipt)
-            except Exception:
-                logger.exception(
-                    "Processed job %s but failed to delete queue message; it may be re-delivered",
-                    job.meeting_id,
-                )
-            else:
-                logger.info("Processed and deleted job %s from queue", job.meeting_id)
+            return job.meeting_id
         finally:
             if renewal_task:
                 renewal_task.cancel()
                 with contextlib.suppress(asyncio.CancelledError):
                     await renewal_task
 
+    async def _delete_message(self, message: Any, job_id: str) -> None:
+        try:
+            await asyncio.to_thread(self._queue_client.delete_message, message.id, message.pop_receipt)
+        except Exception:
+            logger.exception("Processed job %s but failed to delete queue message; it may be re-delivered", job_id)
+        else:
+            logger.info("Processed and deleted job %s from queue", job_id)
+
     async def _renew_visibility(self, message: Any) -> None:
         """Periodically extend message invisibility while a long job runs."""
         if self._visibility_timeout <= 0:
@@ -133,7 +148,7 @@ class AzureQueueWorker:
 
         renew_after = max(1, self._visibility_timeout - min(30, max(1, self._visibility_timeout // 3)))
         while True:
-            await asyncio.sleep(renew_after)
+            await self._sleep(renew_after)
             try:
                 updated = await asyncio.to_thread(
                     self._queue_client.update_message,
@@ -4,25 +4,50 @@ import asyncio
 from collections.abc import Awaitable, Callable
 
 from backend.domain.entities import MeetingImportJob
-from backend.domain.ports import MeetingImportQueuePort
+from backend.domain.ports import MeetingImportQueuePort, MeetingQueueFullError
 from backend.mlflow_logging import logger
 
 
 class BackgroundMeetingImportQueue(MeetingImportQueuePort):
-    """In-process asyncio-based queue used for local/POC deployments."""
+    """In-process asyncio-based queue used for local/POC deployments.
 
-    def __init__(self, handler: Callable[[MeetingImportJob], Awaitable[None]]) -> None:
+    A fixed pool of long-lived worker coroutines drains the queue, so up to ``concurrency`` jobs
+    overlap their I/O. Workers start on ``start()`` or lazily on the first ``enqueue``. At most
+    ``max_depth`` jobs may wait; beyond that ``enqueue`` raises MeetingQueueFullError.
+    """
+
+    def __init__(
+            self,
+            handler: Callable[[MeetingImportJob], Awaitable[None]],
+            *,
+            concurrency: int = 4,
+            max_depth: int = 256,
+    ) -> None:
         self._handler = handler
-        self._queue: asyncio.Queue[MeetingImportJob] = asyncio.Queue()
-        self._worker_task: asyncio.Task[None] | None = None
+        self._concurrency = max(1, concurrency)
+        self._queue: asyncio.Queue[MeetingImportJob] = asyncio.Queue(maxsize=max(0, max_depth))
+        self._workers: list[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self._concurrency)]
+
+    async def aclose(self) -> None:
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
 
     async def enqueue(self, job: MeetingImportJob) -> None:
-        await self._queue.put(job)
-        if not self._worker_task or self._worker_task.done():
-            self._worker_task = asyncio.create_task(self._worker())
+        await self.start()
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull as exc:
+            raise MeetingQueueFullError("Meeting import queue is full; retry later.") from exc
 
     async def _worker(self) -> None:
-        while not self._queue.empty():
+        while True:
             job = await self._queue.get()
             try:
                 await self._handler(job)
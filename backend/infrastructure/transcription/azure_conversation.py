@@ -1,19 +1,117 @@
 from __future__ import annotations
 
+import asyncio
 import azure.cognitiveservices.speech as speechsdk
+import contextvars
+import functools
 import os
 import threading
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from azure.cognitiveservices.speech import transcription as speech_transcription
 from pathlib import Path
-from typing import Callable, List
+from typing import Callable, List, Sequence, TypeVar
 
-from backend.infrastructure.audio import normalizer
+from backend.infrastructure.audio import intros, normalizer
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class IntroChunk:
+    role: str
+    frames: bytes
+    num_frames: int
+
+
+@dataclass(slots=True)
+class _TranscriptionSession:
+    """State shared with the SDK callbacks, which fire on the SDK's own thread."""
+
+    transcriber: speech_transcription.ConversationTranscriber
+    feed_audio: Callable[[], None]
+    segments: deque[str] = field(default_factory=deque)
+    errors: deque[str] = field(default_factory=deque)
+    done: threading.Event = field(default_factory=threading.Event)
+
+
+def _file_version(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _role_at(boundaries: Sequence[dict], starts: Sequence[int], offset_ticks: int) -> str | None:
+    index = bisect_right(starts, offset_ticks) - 1
+    if index >= 0 and offset_ticks < boundaries[index]["end"]:
+        return boundaries[index]["role"]
+    return None
+
+
+@lru_cache(maxsize=4)
+def _speech_config(key: str, region: str, language: str) -> speechsdk.SpeechConfig:
+    """Shared per credentials/language; the SDK reads it when each transcriber is constructed."""
+    config = speechsdk.SpeechConfig(subscription=key, region=region)
+    config.speech_recognition_language = language
+    return config
+
+
+@lru_cache(maxsize=8)
+def _audio_stream_format(sample_rate: int, bits_per_sample: int, channels: int) -> speechsdk.audio.AudioStreamFormat:
+    return speechsdk.audio.AudioStreamFormat(sample_rate, bits_per_sample, channels)
+
+
+@lru_cache(maxsize=1)
+def _default_sdk_executor() -> ThreadPoolExecutor:
+    """Threads for blocking Speech SDK calls, kept apart from the event loop's default executor."""
+    return ThreadPoolExecutor(thread_name_prefix="speech-sdk")
+
+
+@lru_cache(maxsize=8)
+def _silence(num_bytes: int) -> bytes:
+    """Zero-filled PCM gap, allocated once per size and shared by every intro and transcription."""
+    return bytes(num_bytes)
+
+
+@lru_cache(maxsize=8)
+def _decode_intro_chunks(
+        signature: tuple[tuple[str, int, int], ...],
+        sample_rate: int,
+        sample_width: int,
+        channels: int,
+        use_ffmpeg: bool,
+) -> tuple[IntroChunk, ...]:
+    """Decode intro samples once per (files, format) so repeated transcriptions reuse the PCM."""
+    if not signature:
+        return ()
+
+    def _decode(entry: tuple[str, int, int]) -> IntroChunk:
+        path = Path(entry[0])
+        # sync_voices leaves pre-decoded PCM beside each sample; only decode when it is missing or stale.
+        frames = normalizer.read_pcm_sidecar(path, sample_rate=sample_rate, channels=channels)
+        if frames is None:
+            frames, num_frames = normalizer.decode_to_pcm(
+                path.read_bytes(), sample_rate=sample_rate, channels=channels, use_ffmpeg=use_ffmpeg
+            )
+        else:
+            num_frames = len(frames) // (sample_width * channels)
+        return IntroChunk(
+            role=AzureConversationTranscriber._role_from_filename(path),
+            frames=frames,
+            num_frames=num_frames,
+        )
+
+    # Each decode runs in native code (libav or an ffmpeg subprocess), so the files decode in parallel.
+    with ThreadPoolExecutor(max_workers=min(len(signature), os.cpu_count() or 1)) as executor:
+        return tuple(executor.map(_decode, signature))
 
 
 class AzureConversationTranscriber:
     """Azure Cognitive Services backed transcription with intro alignment."""
 
-    SUPPORTED_AUDIO_EXTENSIONS: tuple[str, ...] = (".wav", ".mp3")
+    SUPPORTED_AUDIO_EXTENSIONS: tuple[str, ...] = intros.SUPPORTED_AUDIO_EXTENSIONS
     DEFAULT_TRANSCRIPTION_TIMEOUT_SECONDS: int = 600
     DEFAULT_STOP_TIMEOUT_SECONDS: int = 10
 
@@ -30,6 +128,7 @@ class AzureConversationTranscriber:
             intro_silence_ms: int = 300,
             transcription_timeout: int | None = None,
             stop_timeout: int | None = None,
+            executor: Executor | None = None,
     ) -> None:
         if not key or not region:
             raise ValueError("Azure Speech key and region must be configured")
@@ -49,46 +148,35 @@ class AzureConversationTranscriber:
             os.getenv("TRANSCRIPTION_STOP_TIMEOUT_SECONDS", str(self.DEFAULT_STOP_TIMEOUT_SECONDS))
         )
 
-        self._speech_config = self._build_speech_config()
-
-    def _build_speech_config(self) -> speechsdk.SpeechConfig:
-        config = speechsdk.SpeechConfig(subscription=self._key, region=self._region)
-        config.speech_recognition_language = self._language
-        return config
+        self._use_ffmpeg = os.getenv("AUDIO_DECODER", "pyav").lower() == "ffmpeg"
+        self._executor = executor
+        self._speech_config = _speech_config(self._key, self._region, self._language)
 
-    def _audio_config_from_wav(self, wav_bytes: bytes) -> tuple[speechsdk.audio.AudioConfig, Callable[[], None]]:
-        frames, _, sample_rate, sample_width, channels = normalizer.wav_payload(wav_bytes)
-        stream_format = speechsdk.audio.AudioStreamFormat(
-            sample_rate,
-            sample_width * 8,
-            channels,
-        )
+    def _audio_config_from_pcm(
+            self,
+            frames: Sequence[bytes],
+            sample_rate: int,
+            sample_width: int,
+            channels: int,
+    ) -> tuple[speechsdk.audio.AudioConfig, Callable[[], None]]:
+        # The push stream takes raw PCM plus its format, so no WAV container is built or re-parsed.
+        # It copies each write internally, so chunks are streamed as-is instead of joined first.
+        stream_format = _audio_stream_format(sample_rate, sample_width * 8, channels)
         push_stream = speechsdk.audio.PushAudioInputStream(stream_format=stream_format)
 
         def feed_audio() -> None:
-            push_stream.write(frames)
+            for chunk in frames:
+                push_stream.write(chunk)
             push_stream.close()
 
         audio_config = speechsdk.audio.AudioConfig(stream=push_stream)
         return audio_config, feed_audio
 
-    def _load_intro_chunks(self, sample_rate: int, sample_width: int, channels: int):
-        if not self._intro_dir.exists():
-            return []
-
-        chunks = []
-        for path in sorted(self._intro_dir.glob(self._intro_pattern)):
-            if not path.is_file():
-                continue
-            role = self._role_from_filename(path)
-            wav_bytes = normalizer.convert_to_standard_wav(
-                path.read_bytes(), sample_rate=sample_rate, channels=channels
-            )
-            frames, num_frames, sr, sw, ch = normalizer.wav_payload(wav_bytes)
-            if (sr, sw, ch) != (sample_rate, sample_width, channels):
-                raise ValueError(f"Intro sample {path.name} has incompatible audio format")
-            chunks.append({"role": role, "frames": frames, "num_frames": num_frames})
-        return chunks
+    def _load_intro_chunks(self, sample_rate: int, sample_width: int, channels: int) -> tuple[IntroChunk, ...]:
+        paths = intros.intro_audio_files(self._intro_dir, self._intro_pattern)
+        # Keyed on each file's mtime and size so re-synced voices are decoded again.
+        signature = tuple((str(path), *_file_version(path)) for path in paths)
+        return _decode_intro_chunks(signature, sample_rate, sample_width, channels, self._use_ffmpeg)
 
     @staticmethod
     def _role_from_filename(path: Path) -> str:
@@ -116,22 +204,21 @@ class AzureConversationTranscriber:
     ):
         intros = self._load_intro_chunks(sample_rate, sample_width, channels)
         if not intros:
-            wav_bytes = normalizer.build_wav([meeting_frames], sample_rate, sample_width, channels)
-            return wav_bytes, [], 0
+            return [meeting_frames], [], 0
 
         silence_frames = int(sample_rate * self._intro_silence_ms / 1000)
-        silence_chunk = b"\x00" * silence_frames * sample_width * channels if silence_frames else b""
+        silence_chunk = _silence(silence_frames * sample_width * channels)
 
         frames_sequence: List[bytes] = []
         boundaries = []
         frame_cursor = 0
 
         for intro in intros:
-            frames_sequence.append(intro["frames"])
+            frames_sequence.append(intro.frames)
             start_tick = normalizer.frames_to_ticks(frame_cursor, sample_rate)
-            frame_cursor += intro["num_frames"]
+            frame_cursor += intro.num_frames
             end_tick = normalizer.frames_to_ticks(frame_cursor, sample_rate)
-            boundaries.append({"role": intro["role"], "start": start_tick, "end": end_tick})
+            boundaries.append({"role": intro.role, "start": start_tick, "end": end_tick})
             if silence_chunk:
                 frames_sequence.append(silence_chunk)
                 frame_cursor += silence_frames
@@ -139,30 +226,85 @@ class AzureConversationTranscriber:
         meeting_start_tick = normalizer.frames_to_ticks(frame_cursor, sample_rate)
         frames_sequence.append(meeting_frames)
 
-        combined_wav = normalizer.build_wav(frames_sequence, sample_rate, sample_width, channels)
-        return combined_wav, boundaries, meeting_start_tick
+        return frames_sequence, boundaries, meeting_start_tick
 
     def transcribe(self, content: bytes, filename: str) -> str:
+        session = self._open_session(content, filename)
+        started = False
+        timed_out = False
+        try:
+            session.transcriber.start_transcribing_async().get()
+            session.feed_audio()
+            started = True
+            if not session.done.wait(timeout=self._transcription_timeout):
+                timed_out = True
+        finally:
+            self._cleanup_transcriber(session.transcriber, started, session.done)
+        return self._session_transcript(session, timed_out)
+
+    async def atranscribe(self, content: bytes, filename: str) -> str:
+        """Async twin of ``transcribe`` that awaits the recognition window instead of blocking a thread on it."""
+        loop = asyncio.get_running_loop()
+        finished = asyncio.Event()
+        session = await self._run_blocking(
+            self._open_session, content, filename, lambda: loop.call_soon_threadsafe(finished.set)
+        )
+        started = False
+        timed_out = False
+        try:
+            await self._run_blocking(self._start_session, session)
+            started = True
+            try:
+                await asyncio.wait_for(finished.wait(), timeout=self._transcription_timeout)
+            except TimeoutError:
+                timed_out = True
+        finally:
+            await self._run_blocking(self._cleanup_transcriber, session.transcriber, started, session.done)
+        return self._session_transcript(session, timed_out)
+
+    async def _run_blocking(self, func: Callable[..., T], *args) -> T:
+        # Decoding and SDK start/stop can block for seconds, so they get their own threads rather than
+        # competing with the loop's default executor; the context is copied as asyncio.to_thread does.
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        executor = self._executor or _default_sdk_executor()
+        return await loop.run_in_executor(executor, functools.partial(ctx.run, func, *args))
+
+    @staticmethod
+    def _start_session(session: _TranscriptionSession) -> None:
+        session.transcriber.start_transcribing_async().get()
+        session.feed_audio()
+
+    def _open_session(
+            self,
+            content: bytes,
+            filename: str,
+            on_done: Callable[[], object] | None = None,
+    ) -> _TranscriptionSession:
         if not filename.lower().endswith(self.SUPPORTED_AUDIO_EXTENSIONS):
             raise ValueError(f"Unsupported audio format: {filename}")
 
-        wav_bytes = normalizer.convert_to_standard_wav(
-            content, sample_rate=self._sample_rate, channels=self._channels
+        meeting_frames, _ = normalizer.decode_to_pcm(
+            content, sample_rate=self._sample_rate, channels=self._channels, use_ffmpeg=self._use_ffmpeg
         )
-        meeting_frames, _, sample_rate, sample_width, channels = normalizer.wav_payload(wav_bytes)
-        combined_wav, intro_boundaries, meeting_start_tick = self._prepend_reference_intros(
+        sample_rate, sample_width, channels = self._sample_rate, normalizer.PCM_SAMPLE_WIDTH, self._channels
+        frames_sequence, intro_boundaries, meeting_start_tick = self._prepend_reference_intros(
             meeting_frames, sample_rate, sample_width, channels
         )
-        audio_config, feed_audio = self._audio_config_from_wav(combined_wav)
+        audio_config, feed_audio = self._audio_config_from_pcm(frames_sequence, sample_rate, sample_width, channels)
         transcriber = speech_transcription.ConversationTranscriber(
             speech_config=self._speech_config,
             audio_config=audio_config,
         )
-
-        recognized_segments: List[str] = []
-        done = threading.Event()
-        canceled_error: List[str] = []
+        session = _TranscriptionSession(transcriber=transcriber, feed_audio=feed_audio)
         speaker_roles: dict = {}
+        # Boundaries are laid out back to back in order, so their starts are sorted.
+        intro_starts = [boundary["start"] for boundary in intro_boundaries]
+
+        def _finish() -> None:
+            session.done.set()
+            if on_done is not None:
+                on_done()
 
         def _label_for_speaker(speaker_id: int | None) -> str:
             if speaker_id is None:
@@ -170,10 +312,7 @@ class AzureConversationTranscriber:
             return speaker_roles.get(speaker_id, f"Speaker {speaker_id}")
 
         def _role_for_offset(offset_ticks: int) -> str | None:
-            for boundary in intro_boundaries:
-                if boundary["start"] <= offset_ticks < boundary["end"]:
-                    return boundary["role"]
-            return None
+            return _role_at(intro_boundaries, intro_starts, offset_ticks)
 
         def _recognized_handler(evt: speech_transcription.ConversationTranscriptionEventArgs) -> None:
             result = evt.result
@@ -189,50 +328,41 @@ class AzureConversationTranscriber:
                     if offset_ticks < meeting_start_tick:
                         return
                     label = _label_for_speaker(speaker_id)
-                    recognized_segments.append(f"{label}: {text}")
+                    session.segments.append(f"{label}: {text}")
 
         def _canceled_handler(evt: speech_transcription.ConversationTranscriptionCanceledEventArgs) -> None:
             cancellation_details = evt.result.cancellation_details
             if cancellation_details.reason == speechsdk.CancellationReason.EndOfStream:
-                done.set()
+                _finish()
                 return
 
             error_details = getattr(cancellation_details, "error_details", "")
             message = f"Conversation transcription canceled: {cancellation_details.reason}"
             if error_details:
                 message = f"{message}. {error_details}"
-            canceled_error.append(message)
-            done.set()
+            session.errors.append(message)
+            _finish()
 
         def _stopped_handler(_: speechsdk.SessionEventArgs) -> None:
-            done.set()
+            _finish()
 
         transcriber.transcribed.connect(_recognized_handler)
         transcriber.canceled.connect(_canceled_handler)
         transcriber.session_stopped.connect(_stopped_handler)
+        return session
 
-        started = False
-        timed_out = False
-        try:
-            transcriber.start_transcribing_async().get()
-            feed_audio()
-            started = True
-            if not done.wait(timeout=self._transcription_timeout):
-                timed_out = True
-        finally:
-            self._cleanup_transcriber(transcriber, started, done)
-
-        if canceled_error:
-            raise RuntimeError(canceled_error[0])
+    def _session_transcript(self, session: _TranscriptionSession, timed_out: bool) -> str:
+        if session.errors:
+            raise RuntimeError(session.errors[0])
         if timed_out:
             raise RuntimeError(
                 f"Transcription timed out after {self._transcription_timeout} seconds. "
                 "The audio file may be too long or the service is unresponsive."
             )
-        if not recognized_segments:
+        if not session.segments:
             raise RuntimeError("No speech could be recognized.")
 
-        return "\n".join(recognized_segments)
+        return "\n".join(session.segments)
 
     def _cleanup_transcriber(
             self,
@@ -43,6 +43,15 @@ def meeting_queue() -> MeetingImportQueuePort:
     return get_meeting_queue()
 
 
+async def shutdown_meeting_queue() -> None:
+    """Stop in-process queue workers if the queue was ever created."""
+    if not get_meeting_queue.cache_info().currsize:
+        return
+    aclose = getattr(get_meeting_queue(), "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
 def submit_import_command() -> SubmitMeetingImportCommand:
     return SubmitMeetingImportCommand(repository=get_meetings_repository(), queue=get_meeting_queue())
 
@@ -5,17 +5,17 @@ import os
 import re
 import unicodedata
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from pathlib import Path
 from pydantic import BaseModel, Field
 from typing import Literal
 
 from backend.application.commands.meeting_import import MeetingImportPayload, SubmitMeetingImportCommand
-from backend.application.services.push_to_jira import PushTasksToJiraService
+from backend.application.services.push_to_jira import PushPartialError, PushTasksResult, PushTasksToJiraService
 from backend.container import get_mock_audio_path
-from backend.domain.ports import MeetingsRepositoryPort
+from backend.domain.ports import MeetingQueueFullError, MeetingsRepositoryPort
 from backend.infrastructure.jira import JiraClient, JiraClientError
 from backend.infrastructure.persistence.sqlite import TASK_STATUSES
 from backend.infrastructure.storage.blob import BlobStorageConfigError, BlobStorageService
@@ -100,7 +100,7 @@ def _repo(repo: MeetingsRepositoryPort = Depends(data_repository)) -> MeetingsRe
 
 @router.get("/meetings")
 def list_meetings(repo: MeetingsRepositoryPort = Depends(_repo)):
-    return repo.list_meetings()
+    return ORJSONResponse(repo.list_meetings())
 
 
 @router.post("/meetings", status_code=201)
@@ -145,7 +145,7 @@ def list_meeting_tasks(meeting_id: str, repo: MeetingsRepositoryPort = Depends(_
     meeting = repo.get_meeting(meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
-    return repo.list_tasks(meeting_id=meeting_id)
+    return ORJSONResponse(repo.list_tasks(meeting_id=meeting_id))
 
 
 @router.get("/tasks")
@@ -155,7 +155,7 @@ def list_tasks(
 ):
     if status and status not in TASK_STATUSES:
         raise HTTPException(status_code=400, detail="Invalid status filter")
-    return repo.list_tasks(status=status)
+    return ORJSONResponse(repo.list_tasks(status=status))
 
 
 @router.get("/tasks/{task_id}")
@@ -180,12 +180,31 @@ def bulk_approve_tasks(
         repo: MeetingsRepositoryPort = Depends(_repo),
         jira: JiraClient = Depends(jira_dependency),
 ):
-    service = PushTasksToJiraService(repo=repo, jira_client=jira)
+    service = PushTasksToJiraService(
+        repo=repo,
+        jira_client=jira,
+        max_workers=get_settings().jira.push_max_workers,
+        lookup_miss_ttl=timedelta(hours=get_settings().jira.lookup_miss_ttl_hours),
+    )
     try:
         result = service.push(payload.ids)
+    except PushPartialError as exc:
+        if not exc.result.pushed:
+            raise HTTPException(status_code=502, detail=str(exc)) from exc
+        # Some tasks made it to Jira: report them along with the per-task failures instead of a bare 502.
+        return ORJSONResponse(_push_summary(exc.result), status_code=207)
     except JiraClientError as exc:
         raise HTTPException(status_code=502, detail=str(exc)) from exc
-    return {"updated": result.pushed, "pushed": result.pushed, "skipped": result.skipped}
+    return _push_summary(result)
+
+
+def _push_summary(result: PushTasksResult) -> dict:
+    return {
+        "updated": result.pushed,
+        "pushed": result.pushed,
+        "skipped": result.skipped,
+        "errors": [{"taskId": task_id, "error": message} for task_id, message in result.errors],
+    }
 
 
 @router.post("/tasks/bulk-reject")
@@ -196,7 +215,7 @@ def bulk_reject_tasks(payload: BulkAction, repo: MeetingsRepositoryPort = Depend
 
 @router.get("/users")
 def list_users(repo: MeetingsRepositoryPort = Depends(_repo)):
-    return repo.list_users()
+    return ORJSONResponse(repo.list_users())
 
 
 @router.post("/users/voice", response_model=VoiceUploadResponse, status_code=201)
@@ -281,15 +300,18 @@ async def import_meeting(
         payload: MeetingImportRequest,
         command: SubmitMeetingImportCommand = Depends(submit_import_command),
 ):
-    meeting_id = await command.execute(
-        MeetingImportPayload(
-            title=payload.title,
-            started_at=payload.startedAt,
-            blob_url=payload.blobUrl,
-            original_filename=payload.originalFilename,
-            meeting_id=payload.meetingId,
+    try:
+        meeting_id = await command.execute(
+            MeetingImportPayload(
+                title=payload.title,
+                started_at=payload.startedAt,
+                blob_url=payload.blobUrl,
+                original_filename=payload.originalFilename,
+                meeting_id=payload.meetingId,
+            )
         )
-    )
+    except MeetingQueueFullError as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "30"}) from exc
     return {"meetingId": meeting_id, "status": "queued"}
 
 
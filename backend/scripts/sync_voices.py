@@ -1,22 +1,109 @@
 """Sync intro voice samples from Azure Blob Storage at startup."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import os
 from pathlib import Path
 
+from backend.infrastructure.audio import normalizer
+from backend.settings import get_settings
+
 logger = logging.getLogger(__name__)
 
 AZURE_STORAGE_CONNECTION_STRING = os.getenv("AZURE_STORAGE_CONNECTION_STRING")
 AZURE_STORAGE_CONTAINER_WORKERS = os.getenv("AZURE_STORAGE_CONTAINER_WORKERS")
 INTRO_AUDIO_DIR = os.getenv("INTRO_AUDIO_DIR", "data/voices")
+VOICE_SYNC_CONCURRENCY = int(os.getenv("VOICE_SYNC_CONCURRENCY", "8"))
+
+
+def _pcm_format() -> tuple[int, int]:
+    """Sample rate and channel count the transcriber decodes intros to, so the sidecars match its lookups."""
+    speech = get_settings().azure_speech
+    return speech.sample_rate, speech.channels
+
+
+def _etag_path(local_path: Path) -> Path:
+    return local_path.with_name(f"{local_path.name}.etag")
+
+
+def _file_md5(path: Path) -> bytes:
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, lambda: hashlib.md5(usedforsecurity=False)).digest()
+
+
+def _is_current(local_path: Path, blob) -> bool:
+    """True when the local sample matches the blob, by recorded ETag or, failing that, by content MD5."""
+    if not local_path.exists():
+        return False
+    etag_path = _etag_path(local_path)
+    try:
+        if etag_path.read_text().strip() == blob.etag:
+            return True
+    except OSError:
+        pass
+    content_settings = getattr(blob, "content_settings", None)
+    expected_md5 = getattr(content_settings, "content_md5", None)
+    if expected_md5 and _file_md5(local_path) == bytes(expected_md5):
+        etag_path.write_text(blob.etag)
+        return True
+    return False
+
+
+async def _download(
+        container_client,
+        blob_name: str,
+        etag: str,
+        local_path: Path,
+        semaphore: asyncio.Semaphore,
+) -> None:
+    """Stream one blob to disk, writing to a temp file so partial downloads are never mistaken for samples."""
+    tmp_path = local_path.with_name(f"{local_path.name}.part")
+    async with semaphore:
+        logger.info("Downloading: %s", blob_name)
+        try:
+            # Large blobs are fetched as parallel ranged GETs written straight into the file.
+            stream = await container_client.get_blob_client(blob_name).download_blob(max_concurrency=4)
+            with tmp_path.open("wb") as handle:
+                await stream.readinto(handle)
+            tmp_path.replace(local_path)
+            _etag_path(local_path).write_text(etag)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning("Failed to download %s: %s", blob_name, e)
+            return
+        await asyncio.to_thread(_predecode, local_path)
+
+
+def _has_pcm_sidecar(local_path: Path) -> bool:
+    sample_rate, channels = _pcm_format()
+    sidecar = normalizer.pcm_sidecar_path(local_path, sample_rate=sample_rate, channels=channels)
+    try:
+        return sidecar.stat().st_mtime_ns >= local_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def _predecode(local_path: Path) -> None:
+    """Store the transcriber-ready PCM next to the sample so intros are not decoded at request time."""
+    sample_rate, channels = _pcm_format()
+    try:
+        normalizer.write_pcm_sidecar(
+            local_path,
+            sample_rate=sample_rate,
+            channels=channels,
+            use_ffmpeg=os.getenv("AUDIO_DECODER", "pyav").lower() == "ffmpeg",
+        )
+    except Exception as e:
+        logger.warning("Failed to pre-decode %s; it will be decoded on first use: %s", local_path.name, e)
 
 
-def sync_voices() -> None:
+async def sync_voices() -> None:
     """Download intro_*.mp3 files from Azure Blob Storage.
 
     Skips gracefully if Azure credentials are not configured.
-    Only downloads files that don't already exist locally.
+    Only downloads files that are missing or whose blob ETag changed; up to VOICE_SYNC_CONCURRENCY run at once.
     """
     if not AZURE_STORAGE_CONNECTION_STRING or not AZURE_STORAGE_CONTAINER_WORKERS:
         logger.info("Voice sync skipped: Azure Storage not configured")
@@ -26,22 +113,24 @@ def sync_voices() -> None:
     target_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        from azure.storage.blob import BlobServiceClient
+        from azure.storage.blob.aio import BlobServiceClient
 
-        blob_service = BlobServiceClient.from_connection_string(AZURE_STORAGE_CONNECTION_STRING)
-        container_client = blob_service.get_container_client(AZURE_STORAGE_CONTAINER_WORKERS)
+        async with BlobServiceClient.from_connection_string(AZURE_STORAGE_CONNECTION_STRING) as blob_service:
+            container_client = blob_service.get_container_client(AZURE_STORAGE_CONTAINER_WORKERS)
+            semaphore = asyncio.Semaphore(max(1, VOICE_SYNC_CONCURRENCY))
+            downloads = []
 
-        for blob in container_client.list_blobs():
-            if blob.name.startswith("intro_") and blob.name.endswith(".mp3"):
-                local_path = target_dir / blob.name
-                if local_path.exists():
-                    logger.debug("Skipping existing file: %s", blob.name)
-                    continue
+            async for blob in container_client.list_blobs(name_starts_with="intro_"):
+                if blob.name.endswith(".mp3"):
+                    local_path = target_dir / blob.name
+                    if _is_current(local_path, blob):
+                        logger.debug("Skipping up-to-date file: %s", blob.name)
+                        if not _has_pcm_sidecar(local_path):
+                            downloads.append(asyncio.to_thread(_predecode, local_path))
+                        continue
+                    downloads.append(_download(container_client, blob.name, blob.etag, local_path, semaphore))
 
-                logger.info("Downloading: %s", blob.name)
-                blob_client = container_client.get_blob_client(blob.name)
-                data = blob_client.download_blob().readall()
-                local_path.write_bytes(data)
+            await asyncio.gather(*downloads)
 
         logger.info("Voice sync complete")
 
@@ -51,4 +140,4 @@ def sync_voices() -> None:
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
-    sync_voices()
+    asyncio.run(sync_voices())
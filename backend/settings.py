@@ -16,6 +16,7 @@ class AzureSpeechSettings(BaseModel):
     region: str | None = None
     language: str = "en-US"
     sample_rate: int = 16000
+    channels: int = 1
 
 
 class LLMSettings(BaseModel):
@@ -55,6 +56,8 @@ class JiraSettings(BaseModel):
     api_token: str | None = None
     project_key: str | None = None
     story_points_field: str | None = None
+    push_max_workers: int = 8
+    lookup_miss_ttl_hours: float = 24.0
 
 
 class QueueSettings(BaseModel):
@@ -63,6 +66,9 @@ class QueueSettings(BaseModel):
     visibility_timeout: int = 300
     poll_interval_seconds: float = 2.0
     max_batch_size: int = 16
+    io_workers: int = (os.cpu_count() or 1) * 5
+    local_concurrency: int = 4
+    local_max_depth: int = 256
 
 
 class AzureADSettings(BaseModel):
@@ -112,6 +118,7 @@ class AppConfig(BaseModel):
                 region=os.getenv("AZURE_SPEECH_REGION"),
                 language=os.getenv("AZURE_SPEECH_LANGUAGE", "en-US"),
                 sample_rate=int(os.getenv("TRANSCRIBER_SAMPLE_RATE", "16000")),
+                channels=int(os.getenv("TRANSCRIBER_CHANNELS", "1")),
             ),
             llm=LLMSettings(
                 provider=os.getenv("LLM_PROVIDER", "azure").lower(),
@@ -146,6 +153,8 @@ class AppConfig(BaseModel):
                 api_token=os.getenv("JIRA_API_TOKEN"),
                 project_key=os.getenv("JIRA_PROJECT_KEY"),
                 story_points_field=os.getenv("JIRA_STORY_POINTS_FIELD"),
+                push_max_workers=int(os.getenv("JIRA_PUSH_MAX_WORKERS", "8")),
+                lookup_miss_ttl_hours=float(os.getenv("JIRA_LOOKUP_MISS_TTL_HOURS", "24")),
             ),
             queue=QueueSettings(
                 connection_string=os.getenv("AZURE_STORAGE_QUEUE_CONNECTION_STRING",
@@ -154,6 +163,9 @@ class AppConfig(BaseModel):
                 visibility_timeout=int(os.getenv("MEETING_QUEUE_VISIBILITY_TIMEOUT", "300")),
                 poll_interval_seconds=float(os.getenv("MEETING_QUEUE_POLL_INTERVAL", "2.0")),
                 max_batch_size=int(os.getenv("MEETING_QUEUE_MAX_BATCH", "16")),
+                io_workers=int(os.getenv("MEETING_IO_WORKERS", str((os.cpu_count() or 1) * 5))),
+                local_concurrency=int(os.getenv("MEETING_QUEUE_LOCAL_CONCURRENCY", "4")),
+                local_max_depth=int(os.getenv("MEETING_QUEUE_LOCAL_MAX_DEPTH", "256")),
             ),
             azure_ad=AzureADSettings(
                 tenant_id=os.getenv("AZURE_AD_TENANT_ID"),
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import io
+import math
+import os
+import struct
+import subprocess
+import wave
+
+import pytest
+
+from backend.infrastructure.audio import normalizer
+
+
+def _stereo_wav(seconds: int, sample_rate: int = 8000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setnchannels(2)
+        writer.setsampwidth(2)
+        writer.setframerate(sample_rate)
+        writer.writeframes(
+            b"".join(struct.pack("<hh", int(1000 * math.sin(i / 10)), 0) for i in range(seconds * sample_rate))
+        )
+    return buffer.getvalue()
+
+
+@pytest.mark.skipif(normalizer.av is None, reason="PyAV is not installed")
+def test_decode_to_pcm_resamples_to_mono_16k_in_process():
+    frames, num_frames = normalizer.decode_to_pcm(_stereo_wav(1), sample_rate=16000, channels=1)
+
+    assert num_frames == 16000
+    assert len(frames) == num_frames * normalizer.PCM_SAMPLE_WIDTH
+
+
+@pytest.mark.skipif(normalizer.av is None, reason="PyAV is not installed")
+def test_decode_to_pcm_reports_undecodable_input():
+    with pytest.raises(RuntimeError):
+        normalizer.decode_to_pcm(b"not audio", sample_rate=16000, channels=1)
+
+
+@pytest.mark.skipif(normalizer.av is None, reason="PyAV is not installed")
+def test_decode_to_pcm_falls_back_to_swresample_without_soxr(monkeypatch):
+    monkeypatch.setattr(normalizer, "soxr", None)
+
+    frames, num_frames = normalizer.decode_to_pcm(_stereo_wav(1), sample_rate=16000, channels=1)
+
+    assert num_frames == 16000
+    assert len(frames) == num_frames * normalizer.PCM_SAMPLE_WIDTH
+
+
+@pytest.mark.skipif(normalizer.av is None, reason="PyAV is not installed")
+def test_pcm_sidecar_round_trip_and_staleness(tmp_path):
+    source = tmp_path / "intro_sam.wav"
+    source.write_bytes(_stereo_wav(1))
+
+    assert normalizer.read_pcm_sidecar(source, sample_rate=16000, channels=1) is None
+
+    sidecar = normalizer.write_pcm_sidecar(source, sample_rate=16000, channels=1)
+    cached = normalizer.read_pcm_sidecar(source, sample_rate=16000, channels=1)
+
+    assert sidecar.name == "intro_sam.wav.16000hz1ch.s16.raw"
+    assert cached == normalizer.decode_to_pcm(source.read_bytes(), sample_rate=16000, channels=1)[0]
+    assert normalizer.read_pcm_sidecar(source, sample_rate=8000, channels=1) is None
+
+    os.utime(source, ns=(sidecar.stat().st_mtime_ns + 1, sidecar.stat().st_mtime_ns + 1))
+    assert normalizer.read_pcm_sidecar(source, sample_rate=16000, channels=1) is None
+
+
+def test_ffmpeg_fallback_requests_headerless_pcm(monkeypatch):
+    calls: list[list[str]] = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout=b"\x01\x00" * 320, stderr=b"")
+
+    monkeypatch.setattr(normalizer.shutil, "which", lambda _: "/usr/bin/ffmpeg")
+    monkeypatch.setattr(normalizer.subprocess, "run", fake_run)
+
+    frames, num_frames = normalizer.decode_to_pcm(b"mp3", sample_rate=16000, channels=1, use_ffmpeg=True)
+
+    assert calls[0][calls[0].index("-f") + 1] == "s16le"
+    assert (len(frames), num_frames) == (640, 320)
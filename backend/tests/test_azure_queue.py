@@ -22,12 +22,14 @@ class StubQueueClient:
         self.deleted: list[tuple[str, str]] = []
         self._pending: list[str] = []
         self.updated: list[tuple[str, int | None]] = []
+        self.receive_limits: list[int | None] = []
 
     def send_message(self, payload: str) -> None:
         self.sent.append(payload)
         self._pending.append(payload)
 
-    def receive_messages(self, messages_per_page: int, visibility_timeout: int):
+    def receive_messages(self, messages_per_page: int, visibility_timeout: int, max_messages: int | None = None):
+        self.receive_limits.append(max_messages)
         batch = self._pending[:messages_per_page]
         self._pending = self._pending[messages_per_page:]
         return [StubQueueMessage(content=payload, message_id=str(idx)) for idx, payload in enumerate(batch)]
@@ -109,9 +111,17 @@ async def test_worker_extends_visibility_for_long_running_jobs():
         original_filename=None,
     )
     await queue.enqueue(job)
+    sleeps: list[float] = []
+
+    async def instant_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        await asyncio.sleep(0)
 
     async def slow_handler(_: MeetingImportJob) -> None:
-        await asyncio.sleep(1.1)
+        # Runs until the renewal loop has extended visibility once.
+        while not client.updated:
+            await asyncio.sleep(0.001)
+        worker.stop()
 
     worker = AzureQueueWorker(
         queue_client=client,
@@ -119,14 +129,44 @@ async def test_worker_extends_visibility_for_long_running_jobs():
         visibility_timeout=1,
         poll_interval_seconds=0.01,
         max_batch_size=1,
+        sleep=instant_sleep,
     )
 
-    async def _run_worker_once():
-        task = asyncio.create_task(worker.run_forever())
-        await asyncio.sleep(1.5)
-        worker.stop()
-        await task
-
-    await _run_worker_once()
+    await asyncio.wait_for(worker.run_forever(), timeout=1)
+    assert sleeps and sleeps[0] == 1
     assert client.updated, "Visibility should be extended during long jobs"
     assert client.deleted, "Message should be deleted after processing"
+
+
+@pytest.mark.asyncio
+async def test_worker_acks_successful_jobs_once_per_batch():
+    client = StubQueueClient()
+    queue = AzureMeetingImportQueue(queue_client=client)
+    for meeting_id in ("ok-1", "boom", "ok-2"):
+        await queue.enqueue(
+            MeetingImportJob(
+                meeting_id=meeting_id,
+                title="Batch",
+                started_at="2024-11-05T09:00:00Z",
+                blob_url="https://blob",
+                original_filename=None,
+            )
+        )
+
+    async def handler(job: MeetingImportJob) -> None:
+        if job.meeting_id == "boom":
+            raise RuntimeError("handler failed")
+        if job.meeting_id == "ok-2":
+            worker.stop()
+
+    worker = AzureQueueWorker(
+        queue_client=client,
+        handler=handler,
+        visibility_timeout=0,
+        poll_interval_seconds=0.01,
+        max_batch_size=64,
+    )
+
+    await asyncio.wait_for(worker.run_forever(), timeout=1)
+    assert client.receive_limits == [32]
+    assert sorted(client.deleted) == [("0", "pop-0"), ("2", "pop-2")]
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.infrastructure.audio import normalizer
+from backend.infrastructure.transcription.azure_conversation import (
+    AzureConversationTranscriber,
+    _role_at,
+    _TranscriptionSession,
+)
+
+pytestmark = pytest.mark.skipif(normalizer.av is None, reason="PyAV is not installed")
+
+
+def _wav(frames: int, sample_rate: int = 16000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(sample_rate)
+        writer.writeframes(b"\x01\x00" * frames)
+    return buffer.getvalue()
+
+
+def _transcriber(intro_dir) -> AzureConversationTranscriber:
+    return AzureConversationTranscriber(key="key", region="westeurope", intro_audio_dir=intro_dir)
+
+
+def test_intro_chunks_are_decoded_once_until_files_change(tmp_path):
+    (tmp_path / "intro_adrian_puchacki.wav").write_bytes(_wav(1600))
+    (tmp_path / "intro_sam.wav").write_bytes(_wav(800))
+
+    first = _transcriber(tmp_path)._load_intro_chunks(16000, 2, 1)
+    second = _transcriber(tmp_path)._load_intro_chunks(16000, 2, 1)
+
+    assert second is first
+    assert [(chunk.role, chunk.num_frames) for chunk in first] == [("Adrian Puchacki", 1600), ("Sam", 800)]
+
+    (tmp_path / "intro_sam.wav").write_bytes(_wav(1200))
+    refreshed = _transcriber(tmp_path)._load_intro_chunks(16000, 2, 1)
+
+    assert refreshed is not first
+    assert refreshed[1].num_frames == 1200
+
+
+def test_prepend_reference_intros_returns_raw_pcm_with_boundaries(tmp_path):
+    (tmp_path / "intro_sam.wav").write_bytes(_wav(1600))
+    transcriber = _transcriber(tmp_path)
+
+    chunks, boundaries, meeting_start = transcriber._prepend_reference_intros(b"\x07\x00" * 10, 16000, 2, 1)
+    frames = b"".join(chunks)
+
+    silence_frames = 16000 * 300 // 1000
+    assert len(frames) == (1600 + silence_frames + 10) * 2
+    assert frames.endswith(b"\x07\x00" * 10)
+    assert boundaries == [{"role": "Sam", "start": 0, "end": 1_000_000}]
+    assert meeting_start == normalizer.frames_to_ticks(1600 + silence_frames, 16000)
+
+
+class _Future:
+    def get(self, timeout=None):
+        return None
+
+
+class _Signal:
+    def disconnect_all(self) -> None:
+        pass
+
+
+class _FakeSdkTranscriber:
+    transcribed = canceled = session_stopped = _Signal()
+
+    def start_transcribing_async(self) -> _Future:
+        return _Future()
+
+    def stop_transcribing_async(self) -> _Future:
+        return _Future()
+
+
+def test_atranscribe_awaits_completion_signalled_from_sdk_thread(tmp_path):
+    transcriber = _transcriber(tmp_path)
+
+    def open_session(content, filename, on_done=None):
+        def feed_audio() -> None:
+            def recognize() -> None:
+                session.segments.append("Speaker 1: hello")
+                session.done.set()
+                on_done()
+
+            threading.Thread(target=recognize).start()
+
+        session = _TranscriptionSession(transcriber=_FakeSdkTranscriber(), feed_audio=feed_audio)
+        return session
+
+    transcriber._open_session = open_session
+
+    assert asyncio.run(transcriber.atranscribe(b"", "meeting.wav")) == "Speaker 1: hello"
+
+
+def test_atranscribe_runs_blocking_sdk_calls_on_the_configured_executor(tmp_path):
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="test-speech")
+    transcriber = AzureConversationTranscriber(
+        key="key", region="westeurope", intro_audio_dir=tmp_path, executor=executor
+    )
+    threads: list[str] = []
+
+    def open_session(content, filename, on_done=None):
+        threads.append(threading.current_thread().name)
+
+        def feed_audio() -> None:
+            threads.append(threading.current_thread().name)
+            session.segments.append("Speaker 1: hello")
+            session.done.set()
+            on_done()
+
+        session = _TranscriptionSession(transcriber=_FakeSdkTranscriber(), feed_audio=feed_audio)
+        return session
+
+    transcriber._open_session = open_session
+
+    with executor:
+        assert asyncio.run(transcriber.atranscribe(b"", "meeting.wav")) == "Speaker 1: hello"
+    assert [name.startswith("test-speech") for name in threads] == [True, True]
+
+
+def test_role_lookup_bisects_intro_boundaries():
+    boundaries = [
+        {"role": "Ada", "start": 0, "end": 100},
+        {"role": "Sam", "start": 150, "end": 300},
+    ]
+    starts = [boundary["start"] for boundary in boundaries]
+
+    assert [_role_at(boundaries, starts, offset) for offset in (0, 99, 100, 149, 150, 299, 300)] == [
+        "Ada", "Ada", None, None, "Sam", "Sam", None,
+    ]
+    assert _role_at([], [], 10) is None
+
+
+def test_intro_loader_ignores_sync_sidecars(tmp_path):
+    (tmp_path / "intro_sam.wav").write_bytes(_wav(800))
+    (tmp_path / "intro_sam.wav.etag").write_text('"0x1"')
+    (tmp_path / "intro_ada.mp3.part").write_bytes(b"partial")
+
+    chunks = _transcriber(tmp_path)._load_intro_chunks(16000, 2, 1)
+
+    assert [chunk.role for chunk in chunks] == ["Sam"]
+
+
+def test_transcribers_share_cached_sdk_config(tmp_path):
+    first = _transcriber(tmp_path)
+    second = _transcriber(tmp_path)
+
+    assert second._speech_config is first._speech_config
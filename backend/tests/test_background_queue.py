@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backend.domain.entities import MeetingImportJob
+from backend.domain.ports import MeetingQueueFullError
+from backend.infrastructure.queue.background import BackgroundMeetingImportQueue
+
+
+def _job(meeting_id: str) -> MeetingImportJob:
+    return MeetingImportJob(
+        meeting_id=meeting_id,
+        title="Demo",
+        started_at="2024-10-05T10:00:00Z",
+        blob_url=f"https://blob/{meeting_id}",
+    )
+
+
+def test_background_queue_overlaps_jobs_across_workers():
+    asyncio.run(_run_overlaps_jobs())
+
+
+async def _run_overlaps_jobs():
+    running: set[str] = set()
+    peak = 0
+    release = asyncio.Event()
+
+    async def handler(job: MeetingImportJob) -> None:
+        nonlocal peak
+        running.add(job.meeting_id)
+        peak = max(peak, len(running))
+        await release.wait()
+        running.discard(job.meeting_id)
+
+    queue = BackgroundMeetingImportQueue(handler, concurrency=3)
+    for index in range(3):
+        await queue.enqueue(_job(f"m-{index}"))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.wait_for(queue._queue.join(), timeout=1)
+
+    assert peak == 3
+    await queue.aclose()
+
+
+def test_background_queue_workers_survive_failures_until_closed():
+    asyncio.run(_run_survives_failures())
+
+
+async def _run_survives_failures():
+    processed: list[str] = []
+
+    async def handler(job: MeetingImportJob) -> None:
+        if job.meeting_id == "bad":
+            raise RuntimeError("boom")
+        processed.append(job.meeting_id)
+
+    queue = BackgroundMeetingImportQueue(handler, concurrency=1)
+    await queue.enqueue(_job("bad"))
+    await queue.enqueue(_job("good"))
+    await asyncio.wait_for(queue._queue.join(), timeout=1)
+
+    assert processed == ["good"]
+    workers = list(queue._workers)
+    await queue.aclose()
+    assert all(worker.done() for worker in workers)
+
+
+def test_background_queue_rejects_jobs_beyond_max_depth():
+    asyncio.run(_run_rejects_when_full())
+
+
+async def _run_rejects_when_full():
+    release = asyncio.Event()
+
+    async def handler(job: MeetingImportJob) -> None:
+        await release.wait()
+
+    queue = BackgroundMeetingImportQueue(handler, concurrency=1, max_depth=1)
+    await queue.enqueue(_job("running"))
+    await asyncio.sleep(0)
+    await queue.enqueue(_job("waiting"))
+
+    with pytest.raises(MeetingQueueFullError):
+        await queue.enqueue(_job("overflow"))
+
+    release.set()
+    await queue.aclose()
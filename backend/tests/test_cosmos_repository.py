@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import pytest
+
+from backend.infrastructure.persistence.cosmos.repository import CosmosMeetingsRepository
+
+
+class FakeTasksContainer:
+    def __init__(self, docs: list[dict]) -> None:
+        self.docs = docs
+        self.batches: list[tuple[str, list[str]]] = []
+
+    def query_items(self, *, query, parameters, enable_cross_partition_query):
+        ids = frozenset(parameters[0]["value"])
+        return [doc for doc in self.docs if doc["id"] in ids]
+
+    def execute_item_batch(self, batch_operations, partition_key):
+        self.batches.append((partition_key, [args[0]["id"] for _, args in batch_operations]))
+
+    def upsert_item(self, doc):  # pragma: no cover - should not be used for push marks
+        raise AssertionError("tasks should be written in partition batches")
+
+
+def _repo(docs: list[dict]) -> tuple[CosmosMeetingsRepository, FakeTasksContainer]:
+    repo = CosmosMeetingsRepository.__new__(CosmosMeetingsRepository)
+    repo._tasks = FakeTasksContainer(docs)
+    return repo, repo._tasks
+
+
+def test_mark_tasks_pushed_batches_upserts_per_meeting_partition():
+    repo, tasks = _repo([
+        {"id": "t-1", "meetingId": "m-1"},
+        {"id": "t-2", "meetingId": "m-2"},
+        {"id": "t-3", "meetingId": "m-1"},
+    ])
+
+    repo.mark_tasks_pushed_to_jira([("t-1", "P-1", None), ("t-2", "P-2", None), ("t-3", "P-3", "https://jira/P-3")])
+
+    assert tasks.batches == [("m-1", ["t-1", "t-3"]), ("m-2", ["t-2"])]
+    assert tasks.docs[2]["jiraIssueUrl"] == "https://jira/P-3"
+    assert all(doc["status"] == "approved" for doc in tasks.docs)
+
+
+def test_mark_tasks_pushed_returns_missing_tasks_after_writing_the_rest():
+    repo, tasks = _repo([{"id": "t-1", "meetingId": "m-1"}])
+
+    assert repo.mark_tasks_pushed_to_jira([("t-1", "P-1", None), ("gone", "P-2", None)]) == ["gone"]
+    assert tasks.batches == [("m-1", ["t-1"])]
+
+
+def test_mark_single_task_pushed_raises_for_unknown_task():
+    repo, tasks = _repo([])
+
+    with pytest.raises(ValueError):
+        repo.mark_task_pushed_to_jira("gone", issue_key="P-1", issue_url=None)
+
+    assert tasks.batches == []
+
+
+class FakeUsersContainer:
+    def __init__(self, docs: list[dict]) -> None:
+        self.docs = {doc["id"]: doc for doc in docs}
+        self.queries: list[list[str]] = []
+        self.point_reads: list[str] = []
+
+    def query_items(self, *, query, parameters, enable_cross_partition_query):
+        ids = parameters[0]["value"]
+        self.queries.append(sorted(ids))
+        return [self.docs[user_id] for user_id in ids if user_id in self.docs]
+
+    def read_item(self, *, item, partition_key):
+        self.point_reads.append(item)
+        return self.docs[item]
+
+
+def test_get_users_fetches_all_ids_in_one_query():
+    repo = CosmosMeetingsRepository.__new__(CosmosMeetingsRepository)
+    repo._users = FakeUsersContainer([
+        {"id": "u-1", "displayName": "Ada", "jiraAccountId": "acc-1"},
+        {"id": "u-2", "displayName": "Sam"},
+    ])
+
+    users = repo.get_users(["u-1", "u-2", "missing"])
+
+    assert repo._users.queries == [["missing", "u-1", "u-2"]]
+    assert repo._users.point_reads == []
+    assert users["u-1"]["jiraAccountId"] == "acc-1"
+    assert set(users) == {"u-1", "u-2"}
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
+from backend import audit
 from backend.application.use_cases.extract_meeting import ExtractMeetingUseCase
 from backend.schemas import ExtractionResult, IssueType, Task
 
@@ -144,3 +148,73 @@ async def _run_accepts_blob_reference():
     assert repo.captured is not None
     assert repo.captured["title"] == "Blob Meeting"
     assert repo.captured["filename"] == "blobfile.txt"
+
+
+def test_extract_meeting_use_case_awaits_async_extractor():
+    asyncio.run(_run_awaits_async_extractor())
+
+
+async def _run_awaits_async_extractor():
+    class AsyncExtractor(DummyExtractor):
+        async def aextract(self, transcript: str) -> ExtractionResult:
+            self.transcript = f"async:{transcript}"
+            return self._result
+
+    result = ExtractionResult(
+        tasks=[Task(summary="Ship release", description="Tag and deploy", issue_type=IssueType.TASK)]
+    )
+    extractor = AsyncExtractor(result)
+    workflow = ExtractMeetingUseCase(
+        blob_storage=DummyBlobStorage(b"Async transcript"),
+        transcription=None,
+        extractor=extractor,
+        meetings_repo=DummyRepository(),
+        telemetry=None,
+    )
+
+    await workflow(
+        title="Async Meeting",
+        started_at="2024-10-03T09:00:00Z",
+        blob_url="https://storage/meetings/async.txt",
+        original_filename="async.txt",
+    )
+
+    assert extractor.transcript == "async:Async transcript"
+
+
+def test_extract_meeting_use_case_runs_blocking_calls_on_io_executor():
+    asyncio.run(_run_blocking_calls_on_io_executor())
+
+
+async def _run_blocking_calls_on_io_executor():
+    class RecordingExtractor(DummyExtractor):
+        def extract(self, transcript: str) -> ExtractionResult:
+            self.thread = threading.current_thread().name
+            self.actor = audit.current_actor()
+            return super().extract(transcript)
+
+    extractor = RecordingExtractor(
+        ExtractionResult(tasks=[Task(summary="Triage", description="Sort the inbox", issue_type=IssueType.TASK)])
+    )
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="meeting-io") as executor:
+        workflow = ExtractMeetingUseCase(
+            blob_storage=DummyBlobStorage(b"Executor transcript"),
+            transcription=None,
+            extractor=extractor,
+            meetings_repo=DummyRepository(),
+            telemetry=None,
+            io_executor=executor,
+        )
+        token = audit.bind_actor("tester")
+        try:
+            await workflow(
+                title="Executor Meeting",
+                started_at="2024-10-04T09:00:00Z",
+                blob_url="https://storage/meetings/executor.txt",
+                original_filename="executor.txt",
+            )
+        finally:
+            audit.reset_actor(token)
+
+    assert extractor.thread.startswith("meeting-io")
+    assert extractor.actor == "tester"
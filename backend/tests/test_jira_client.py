@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
+from urllib3.response import HTTPResponse
+
+from backend.infrastructure.jira import JiraClient, JiraClientError
+
+
+def _client() -> JiraClient:
+    return JiraClient(
+        base_url="https://example.atlassian.net",
+        email="bot@example.com",
+        api_token="token",
+        project_key="SCRUM",
+    )
+
+
+def _issue(summary: str) -> dict:
+    return {
+        "summary": summary,
+        "description": None,
+        "issue_type": "Task",
+        "priority": "Medium",
+        "labels": None,
+        "assignee_account_id": None,
+        "story_points": None,
+        "source_quote": None,
+    }
+
+
+def test_bulk_create_aligns_results_with_rejected_elements():
+    client = _client()
+    sent: list[dict] = []
+
+    def fake_request(method, path, payload, **kwargs):
+        sent.append(payload)
+        body = {"issues": [{"key": "SCRUM-7"}], "errors": [{"failedElementNumber": 0, "status": 400}]}
+        raise JiraClientError("bad request", status_code=400, body=json.dumps(body))
+
+    client._request = fake_request
+
+    issues = client.bulk_create_issues([_issue("Rejected"), _issue("Accepted")])
+
+    assert issues[0] is None
+    assert issues[1].key == "SCRUM-7"
+    assert issues[1].url == "https://example.atlassian.net/browse/SCRUM-7"
+    assert [update["fields"]["summary"] for update in sent[0]["issueUpdates"]] == ["Rejected", "Accepted"]
+
+
+def test_bulk_create_reraises_errors_without_element_details():
+    client = _client()
+
+    def fake_request(method, path, payload, **kwargs):
+        raise JiraClientError("unavailable", status_code=503)
+
+    client._request = fake_request
+
+    with pytest.raises(JiraClientError):
+        client.bulk_create_issues([_issue("Outage")])
+
+
+def test_create_issue_builds_fields_from_payload_dict():
+    client = _client()
+    sent: list[dict] = []
+
+    def fake_request(method, path, payload, **kwargs):
+        sent.append(payload)
+        return {"key": "SCRUM-3"}
+
+    client._request = fake_request
+    payload = _issue("  Ship it  ") | {"labels": ["backend"], "assignee_account_id": "acc-1"}
+
+    issue = client.create_issue(payload)
+
+    assert issue.key == "SCRUM-3"
+    fields = sent[0]["fields"]
+    assert fields["summary"] == "Ship it"
+    assert fields["labels"] == ["backend"]
+    assert fields["assignee"] == {"accountId": "acc-1"}
+    assert "description" not in fields
+
+
+def test_user_lookup_is_cached_by_normalized_name():
+    client = _client()
+    calls: list[dict] = []
+
+    def fake_request(method, path, payload, **kwargs):
+        calls.append(kwargs["params"])
+        return [{"accountId": "acc-1"}] if kwargs["params"]["query"] == "Sam Carter" else []
+
+    client._request = fake_request
+
+    assert client.find_user_account_id("Sam Carter") == "acc-1"
+    assert client.find_user_account_id(" sam carter ") == "acc-1"
+    assert client.find_user_account_id("Unknown") is None
+    assert client.find_user_account_id("unknown") is None
+    assert len(calls) == 3, "misses are not cached by the client"
+
+    client.clear_user_cache()
+    client.find_user_account_id("Sam Carter")
+    assert len(calls) == 4
+
+
+def test_build_description_keeps_line_breaks_and_quote():
+    doc = _client()._build_description("  First line\n\n  Second line  ", "Let's ship it")
+
+    assert doc["content"] == [
+        {"type": "paragraph", "content": [{"type": "text", "text": "First line"}]},
+        {"type": "paragraph", "content": []},
+        {"type": "paragraph", "content": [{"type": "text", "text": "Second line"}]},
+        {
+            "type": "blockquote",
+            "content": [{"type": "paragraph", "content": [{"type": "text", "text": "Let's ship it"}]}],
+        },
+    ]
+    assert _client()._build_description("   ", None) is None
+
+
+def test_request_sends_orjson_encoded_body_and_parses_response():
+    client = _client()
+    captured: dict = {}
+
+    class _Response:
+        content = b'{"key": "SCRUM-1"}'
+
+        def raise_for_status(self) -> None:
+            pass
+
+    def fake_session_request(method, url, **kwargs):
+        captured.update(kwargs)
+        return _Response()
+
+    client._session.request = fake_session_request
+
+    result = client._request("POST", "/issue", {"fields": {"summary": "Zażółć"}})
+
+    assert result == {"key": "SCRUM-1"}
+    assert isinstance(captured["data"], bytes)
+    assert json.loads(captured["data"]) == {"fields": {"summary": "Zażółć"}}
+
+
+def test_session_keeps_one_connection_pool_sized_for_push_workers():
+    client = JiraClient(
+        base_url="https://example.atlassian.net",
+        email="bot@example.com",
+        api_token="token",
+        project_key="SCRUM",
+        pool_maxsize=64,
+    )
+
+    adapter = client._session.get_adapter("https://example.atlassian.net/rest/api/3/issue")
+
+    assert adapter._pool_connections == 1
+    assert adapter._pool_maxsize == 64
+    assert client._session.get_adapter("https://example.atlassian.net/rest/api/3/search") is adapter
+
+
+def test_retry_policy_never_replays_issue_creation_after_jira_may_have_committed():
+    retry = _client()._session.get_adapter("https://example.atlassian.net/rest/api/3/issue").max_retries
+
+    assert [retry.is_retry("POST", status) for status in (429, 503)] == [True, True]
+    assert [retry.is_retry("POST", status) for status in (500, 502, 504)] == [False, False, False]
+    assert retry.is_retry("GET", 502)
+
+    timeout = ReadTimeoutError(None, "/rest/api/3/issue", "read timed out")
+    with pytest.raises(ReadTimeoutError):
+        retry.increment(method="POST", url="/rest/api/3/issue", error=timeout)
+    assert retry.increment(method="GET", url="/rest/api/3/user/search", error=timeout).total == 4
+
+
+def test_retry_policy_gives_up_instead_of_waiting_past_the_backoff_cap():
+    retry = _client()._session.get_adapter("https://example.atlassian.net/rest/api/3/issue").max_retries
+
+    def throttled(seconds: int) -> HTTPResponse:
+        return HTTPResponse(status=429, headers={"Retry-After": str(seconds)}, preload_content=False)
+
+    assert retry.increment(method="POST", url="/rest/api/3/issue", response=throttled(30)).total == 4
+    with pytest.raises(MaxRetryError):
+        retry.increment(method="POST", url="/rest/api/3/issue", response=throttled(3600))
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from backend.infrastructure.llm.task_extractor import LLMExtractor, _fuzzy_match_speaker, _known_voice_names
+from backend.schemas import ExtractionResult
+
+PAYLOAD = {
+    "tasks": [
+        {
+            "summary": "Fix login bug",
+            "description": "Users cannot log in with SSO",
+            "issue_type": "Bug",
+            "assignee_name": "Adrian",
+        }
+    ]
+}
+
+
+def _fake_llm(*responses: str) -> GenericFakeChatModel:
+    return GenericFakeChatModel(messages=iter(AIMessage(content=response) for response in responses))
+
+
+def test_complete_joins_streamed_chunks():
+    llm = _fake_llm(json.dumps(PAYLOAD))
+
+    raw = LLMExtractor._complete(llm, [HumanMessage(content="Transcript")])
+
+    assert json.loads(raw) == PAYLOAD
+
+
+def test_aextract_many_runs_each_transcript(monkeypatch):
+    monkeypatch.setattr(LLMExtractor, "_build_llm", staticmethod(lambda: _fake_llm(*[json.dumps(PAYLOAD)] * 2)))
+    extractor = LLMExtractor()
+
+    results = asyncio.run(extractor.aextract_many(["Adrian: fix login", "Adrian: fix login again"]))
+
+    assert [len(result.tasks) for result in results] == [1, 1]
+
+
+def test_llm_client_is_built_once_per_extractor(monkeypatch):
+    built: list[GenericFakeChatModel] = []
+
+    def build_llm():
+        built.append(_fake_llm(json.dumps(PAYLOAD), json.dumps(PAYLOAD)))
+        return built[-1]
+
+    monkeypatch.setattr(LLMExtractor, "_build_llm", staticmethod(build_llm))
+    extractor = LLMExtractor()
+
+    extractor.extract("Adrian: fix login")
+    extractor.extract("Adrian: fix login again")
+
+    assert len(built) == 1
+
+
+def test_fuzzy_match_speaker_resolves_partial_and_misspelled_names():
+    speakers = ["Adrian Puchacki", "Sam Carter"]
+
+    assert _fuzzy_match_speaker("adrian", speakers) == "Adrian Puchacki"
+    assert _fuzzy_match_speaker("Sam Cartr", speakers) == "Sam Carter"
+    assert _fuzzy_match_speaker("Zoe", speakers) is None
+
+
+def test_known_voice_names_ignore_sync_sidecars(tmp_path):
+    (tmp_path / "intro_sam.mp3").write_bytes(b"voice")
+    (tmp_path / "intro_sam.mp3.etag").write_text('"0x1"')
+    (tmp_path / "intro_sam.mp3.16000hz1ch.s16.raw").write_bytes(b"\x00\x00")
+    (tmp_path / "intro_ada_lovelace.mp3.part").write_bytes(b"partial")
+
+    assert _known_voice_names(tmp_path) == ["Sam"]
+
+
+def test_validate_assignees_maps_matches_back_to_canonical_names():
+    result = ExtractionResult.model_validate(
+        {
+            "tasks": [
+                {**PAYLOAD["tasks"][0], "assignee_name": "adrian"},
+                {**PAYLOAD["tasks"][0], "assignee_name": "ADRIAN"},
+                {**PAYLOAD["tasks"][0], "assignee_name": "Zoe"},
+            ]
+        }
+    )
+
+    validated = LLMExtractor._validate_assignees(result, ["Adrian Puchacki", "Sam Carter"])
+
+    assert [task.assignee_name for task in validated.tasks] == ["Adrian Puchacki", "Adrian Puchacki", None]
+
+
+def test_extract_reuses_cached_result_when_enabled(monkeypatch, tmp_path):
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "1")
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(LLMExtractor, "_build_llm", staticmethod(lambda: _fake_llm(json.dumps(PAYLOAD))))
+
+    first = LLMExtractor().extract("Adrian: fix login")
+    # The fake model only has one response, so a second LLM call would fail.
+    second = LLMExtractor().extract("Adrian: fix login")
+
+    assert second == first
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_concurrent_cache_writes_use_separate_temp_files(tmp_path):
+    path = tmp_path / "entry.json"
+    result = ExtractionResult.model_validate(PAYLOAD)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: LLMExtractor._write_cache(path, result), range(32)))
+
+    assert ExtractionResult.model_validate_json(path.read_text(encoding="utf-8")) == result
+    assert [entry.name for entry in tmp_path.iterdir()] == ["entry.json"]
+
+
+def test_malformed_json_is_repaired_without_llm_round_trip():
+    payload = "Here are the tasks:\n" + json.dumps(PAYLOAD)[:-2] + ",]}"
+    # An exhausted fake model fails loudly if the LLM repair path is taken.
+    llm = _fake_llm()
+
+    result = LLMExtractor._parse_or_repair_response(llm, payload)
+
+    assert [task.summary for task in result.tasks] == ["Fix login bug"]
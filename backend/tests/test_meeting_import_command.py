@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import asyncio
-import asyncio
-import pytest
 from dataclasses import dataclass
 
+import pytest
+
 from backend.application.commands.meeting_import import MeetingImportPayload, SubmitMeetingImportCommand
 from backend.domain.entities import MeetingImportJob
+from backend.domain.ports import MeetingQueueFullError
 
 
 @dataclass
@@ -51,3 +52,24 @@ async def _run_submit_command():
     assert meeting_id == "abc"
     assert repo.stub_calls == [("abc", "Demo", "2024-10-05T10:00:00Z", "https://blob/url")]
     assert queue.jobs and queue.jobs[0].meeting_id == "abc"
+
+
+def test_submit_meeting_import_command_marks_meeting_failed_when_queue_full():
+    asyncio.run(_run_submit_with_full_queue())
+
+
+async def _run_submit_with_full_queue():
+    class FullQueue:
+        async def enqueue(self, job: MeetingImportJob) -> None:
+            raise MeetingQueueFullError("full")
+
+    repo = StubRepo()
+    command = SubmitMeetingImportCommand(repository=repo, queue=FullQueue())
+
+    with pytest.raises(MeetingQueueFullError):
+        await command.execute(
+            MeetingImportPayload(title="Demo", started_at="2024-10-05T10:00:00Z", blob_url="https://blob/url",
+                                 meeting_id="abc")
+        )
+
+    assert repo.status == ("abc", "failed")
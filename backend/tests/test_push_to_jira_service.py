@@ -1,43 +1,69 @@
 from __future__ import annotations
 
+import itertools
+import json
+import threading
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
-from backend.application.services.push_to_jira import PushTasksToJiraService
-from backend.infrastructure.jira import JiraClientError, JiraIssue
+from backend.application.services import push_to_jira
+from backend.application.services.push_to_jira import PushPartialError, PushTasksToJiraService
+from backend.infrastructure.jira import JiraClient, JiraClientError, JiraIssue
+from backend.presentation.http.ui_router import BulkAction, bulk_approve_tasks
 
 
 class FakeRepo:
     def __init__(self, tasks: list[dict], users: dict[str, dict] | None = None) -> None:
-        self._tasks = tasks
+        self._by_id = {task["id"]: task for task in tasks}
         self.marked: list[tuple[str, str, str | None]] = []
+        self.mark_calls = 0
         self.users = users or {}
+        self.user_batches: list[set[str]] = []
 
     def get_tasks_by_ids(self, ids):
-        return [task for task in self._tasks if task["id"] in ids]
+        # Deduplicate like the SQL repositories do, then index instead of scanning every task per id.
+        return [self._by_id[task_id] for task_id in dict.fromkeys(ids) if task_id in self._by_id]
 
-    def mark_task_pushed_to_jira(self, task_id: str, *, issue_key: str, issue_url: str | None) -> None:
-        self.marked.append((task_id, issue_key, issue_url))
+    def mark_tasks_pushed_to_jira(self, rows) -> list[str]:
+        self.mark_calls += 1
+        self.marked.extend(rows)
+        return [task_id for task_id, _, _ in rows if task_id not in self._by_id]
 
     def get_user(self, user_id: str):
         return self.users.get(user_id)
 
+    def get_users(self, ids):
+        self.user_batches.append(set(ids))
+        return {user_id: self.users[user_id] for user_id in ids if user_id in self.users}
+
     def update_user_jira_account(self, user_id: str, account_id: str) -> None:
         if user_id in self.users:
             self.users[user_id]["jiraAccountId"] = account_id
 
+    def update_user_jira_lookup_miss(self, user_id: str, missed_at: str) -> None:
+        if user_id in self.users:
+            self.users[user_id]["jiraLookupMissAt"] = missed_at
+
 
 class FakeJiraClient:
     def __init__(self) -> None:
-        self.calls: list[dict] = []
-        self.counter = 0
+        self.calls: deque[dict] = deque()
+        self._keys = itertools.count(1)
         self.lookup: dict[str, str] = {}
+        self.bulk_sizes: list[int] = []
 
-    def create_issue(self, **payload):
-        self.counter += 1
+    def create_issue(self, payload):
+        # next() on itertools.count is atomic, so keys stay unique when the service pushes from threads.
+        key = f"SCRUM-{next(self._keys)}"
         self.calls.append(payload)
-        key = f"SCRUM-{self.counter}"
         return JiraIssue(key=key, url=f"https://example.atlassian.net/browse/{key}")
 
+    def bulk_create_issues(self, payloads):
+        self.bulk_sizes.append(len(payloads))
+        return [self.create_issue(payload) for payload in payloads]
+
     def find_user_account_id(self, display_name: str) -> str | None:
         return self.lookup.get(display_name)
 
@@ -82,14 +108,53 @@ def test_skips_tasks_already_linked_to_jira():
     assert result.pushed == 0
     assert result.skipped == 1
     assert repo.marked == []
-    assert jira.calls == []
+    assert not jira.calls
+
+
+def test_skipped_tasks_do_no_assignee_or_payload_work(monkeypatch):
+    task = {
+        "id": "task-1",
+        "summary": "Done task",
+        "jiraIssueKey": "SCRUM-9",
+        "assigneeId": "user-42",
+        "labels": ["Needs Cleanup"],
+    }
+    users = {"user-42": {"id": "user-42", "displayName": "Sam Carter", "jiraAccountId": None}}
+    repo = FakeRepo([task], users=users)
+    jira = FakeJiraClient()
+    service = PushTasksToJiraService(repo=repo, jira_client=jira)
+    monkeypatch.setattr(service, "_issue_payload", lambda *args, **kwargs: pytest.fail("payload built for skipped task"))
+
+    service.push([task["id"]])
+
+    assert repo.user_batches == []
+    assert jira.bulk_sizes == []
+
+
+def test_all_linked_tasks_return_without_starting_a_pool(monkeypatch):
+    tasks = [
+        {"id": "task-1", "summary": "Done", "jiraIssueKey": "SCRUM-1"},
+        {"id": "task-2", "summary": "Also done", "jiraIssueKey": "SCRUM-2"},
+    ]
+    repo = FakeRepo(tasks)
+    jira = FakeJiraClient()
+    monkeypatch.setattr(push_to_jira, "ThreadPoolExecutor", lambda **kwargs: pytest.fail("pool started"))
+
+    result = PushTasksToJiraService(repo=repo, jira_client=jira).push([task["id"] for task in tasks])
+
+    assert (result.total, result.pushed, result.skipped) == (2, 0, 2)
+    assert not jira.calls
+    assert repo.marked == []
 
 
 def test_raises_when_jira_rejects_request():
     class FailJiraClient(FakeJiraClient):
-        def create_issue(self, **payload):
+        def create_issue(self, payload):
             raise JiraClientError("boom")
 
+        def bulk_create_issues(self, payloads):
+            raise JiraClientError("boom", status_code=400)
+
     task = {"id": "task-1", "summary": "Broken"}
     repo = FakeRepo([task])
     jira = FailJiraClient()
@@ -133,3 +198,314 @@ def test_looks_up_jira_account_when_missing(tmp_path=None):
 
     assert repo.users["user-42"]["jiraAccountId"] == "jira-user-123"
     assert jira.calls[0]["assignee_account_id"] == "jira-user-123"
+
+
+def test_pushes_tasks_in_bulk_batches():
+    tasks = [{"id": f"task-{idx}", "summary": f"Task {idx}"} for idx in range(120)]
+    repo = FakeRepo(tasks)
+    jira = FakeJiraClient()
+    service = PushTasksToJiraService(repo=repo, jira_client=jira)
+
+    result = service.push([task["id"] for task in tasks])
+
+    assert result.pushed == 120
+    assert jira.bulk_sizes == [50, 50, 20]
+    assert repo.mark_calls == 1
+    assert [marked[0] for marked in repo.marked] == [task["id"] for task in tasks]
+
+
+def test_retries_rejected_bulk_items_individually():
+    class PartialJiraClient(FakeJiraClient):
+        def bulk_create_issues(self, payloads):
+            self.bulk_sizes.append(len(payloads))
+            return [None if payload["summary"] == "Rejected" else self.create_issue(payload) for payload in payloads]
+
+    tasks = [
+        {"id": "task-1", "summary": "Accepted"},
+        {"id": "task-2", "summary": "Rejected"},
+    ]
+    repo = FakeRepo(tasks)
+    jira = PartialJiraClient()
+    service = PushTasksToJiraService(repo=repo, jira_client=jira)
+
+    result = service.push(["task-1", "task-2"])
+
+    assert result.pushed == 2
+    assert [call["summary"] for call in jira.calls] == ["Accepted", "Rejected"]
+    assert repo.marked[1][0] == "task-2"
+
+
+def test_propagates_bulk_server_errors_without_retrying():
+    class DownJiraClient(FakeJiraClient):
+        def bulk_create_issues(self, payloads):
+            raise JiraClientError("unavailable", status_code=503)
+
+    task = {"id": "task-1", "summary": "Outage"}
+    repo = FakeRepo([task])
+    jira = DownJiraClient()
+    service = PushTasksToJiraService(repo=repo, jira_client=jira)
+
+    with pytest.raises(JiraClientError):
+        service.push([task["id"]])
+    assert not jira.calls
+
+
+@pytest.mark.parametrize("status", [401, 403, 404, 429])
+def test_bulk_auth_and_throttle_errors_are_not_fanned_out_per_task(status):
+    class DeniedJiraClient(FakeJiraClient):
+        def bulk_create_issues(self, payloads):
+            raise JiraClientError("denied", status_code=status)
+
+    tasks = [{"id": f"task-{idx}", "summary": f"Task {idx}"} for idx in range(3)]
+    jira = DeniedJiraClient()
+
+    with pytest.raises(JiraClientError):
+        PushTasksToJiraService(repo=FakeRepo(tasks), jira_client=jira).push([task["id"] for task in tasks])
+    assert not jira.calls
+
+
+def test_marks_successful_batches_before_raising_batch_failure():
+    class FlakyJiraClient(FakeJiraClient):
+        def bulk_create_issues(self, payloads):
+            if payloads[0]["summary"] == "Task 0":
+                raise JiraClientError("unavailable", status_code=503)
+            return super().bulk_create_issues(payloads)
+
+    tasks = [{"id": f"task-{idx}", "summary": f"Task {idx}"} for idx in range(60)]
+    repo = FakeRepo(tasks)
+    jira = FlakyJiraClient()
+    service = PushTasksToJiraService(repo=repo, jira_client=jira, max_workers=2)
+
+    with pytest.raises(JiraClientError):
+        service.push([task["id"] for task in tasks])
+    assert [marked[0] for marked in repo.marked] == [f"task-{idx}" for idx in range(50, 60)]
+
+
+def test_marks_created_issues_before_reraising_unexpected_errors():
+    class BrokenJiraClient(FakeJiraClient):
+        def bulk_create_issues(self, payloads):
+            if payloads[0]["summary"] == "Task 0":
+                raise RuntimeError("connection reset")
+            return super().bulk_create_issues(payloads)
+
+    tasks = [{"id": f"task-{idx}", "summary": f"Task {idx}"} for idx in range(60)]
+    repo = FakeRepo(tasks)
+    service = PushTasksToJiraService(repo=repo, jira_client=BrokenJiraClient(), max_workers=2)
+
+    with pytest.raises(RuntimeError):
+        service.push([task["id"] for task in tasks])
+    assert [marked[0] for marked in repo.marked] == [f"task-{idx}" for idx in range(50, 60)]
+
+
+def test_collects_per_task_errors_and_raises_them_together():
+    class PickyJiraClient(FakeJiraClient):
+        def bulk_create_issues(self, payloads):
+            return [None] * len(payloads)
+
+        def create_issue(self, payload):
+            if payload["summary"].startswith("Bad"):
+                raise JiraClientError(f"rejected {payload['summary']}", status_code=400)
+            return super().create_issue(payload)
+
+    tasks = [
+        {"id": "task-1", "summary": "Bad one"},
+        {"id": "task-2", "summary": "Good"},
+        {"id": "task-3", "summary": "Bad two"},
+    ]
+    repo = FakeRepo(tasks)
+    service = PushTasksToJiraService(repo=repo, jira_client=PickyJiraClient())
+
+    with pytest.raises(PushPartialError) as excinfo:
+        service.push([task["id"] for task in tasks])
+
+    assert excinfo.value.status_code == 400
+    assert excinfo.value.result.pushed == 1
+    assert sorted(task_id for task_id, _ in excinfo.value.errors) == ["task-1", "task-3"]
+    assert [marked[0] for marked in repo.marked] == ["task-2"]
+
+    result = service.push(["task-1"], raise_on_error=False)
+    assert (result.pushed, result.errors) == (0, [("task-1", "rejected Bad one")])
+
+
+def test_resolves_each_assignee_once_per_push():
+    tasks = [
+        {"id": "task-1", "summary": "First", "assigneeId": "user-42"},
+        {"id": "task-2", "summary": "Second", "assigneeId": "user-42"},
+        {"id": "task-3", "summary": "Third", "assigneeId": "user-7"},
+    ]
+    users = {
+        "user-42": {"id": "user-42", "displayName": "Sam Carter", "jiraAccountId": None},
+        "user-7": {"id": "user-7", "displayName": "Alex Kim", "jiraAccountId": "jira-user-7"},
+    }
+    repo = FakeRepo(tasks, users=users)
+    jira = FakeJiraClient()
+    lookups: list[str] = []
+
+    def find_user_account_id(display_name: str) -> str | None:
+        lookups.append(display_name)
+        return "jira-user-42"
+
+    jira.find_user_account_id = find_user_account_id
+    service = PushTasksToJiraService(repo=repo, jira_client=jira)
+
+    service.push([task["id"] for task in tasks])
+
+    assert repo.user_batches == [{"user-42", "user-7"}]
+    assert lookups == ["Sam Carter"]
+    assert [call["assignee_account_id"] for call in jira.calls] == ["jira-user-42", "jira-user-42", "jira-user-7"]
+
+
+def test_retries_rejected_items_concurrently_and_keeps_successes():
+    class RejectingJiraClient(FakeJiraClient):
+        def __init__(self) -> None:
+            super().__init__()
+            self.barrier = threading.Barrier(2, timeout=1)
+            self._lock = threading.Lock()
+
+        def bulk_create_issues(self, payloads):
+            self.bulk_sizes.append(len(payloads))
+            return [None] * len(payloads)
+
+        def create_issue(self, payload):
+            # Both retries must be in flight at once to get past the barrier.
+            self.barrier.wait()
+            if payload["summary"] == "Broken":
+                raise JiraClientError("invalid", status_code=400)
+            with self._lock:
+                return super().create_issue(payload)
+
+    tasks = [{"id": "task-1", "summary": "Fine"}, {"id": "task-2", "summary": "Broken"}]
+    repo = FakeRepo(tasks)
+    service = PushTasksToJiraService(repo=repo, jira_client=RejectingJiraClient(), max_workers=2)
+
+    with pytest.raises(JiraClientError):
+        service.push(["task-1", "task-2"])
+    assert [marked[0] for marked in repo.marked] == ["task-1"]
+
+
+def test_caches_account_lookups_by_display_name_within_a_push():
+    tasks = [
+        {"id": "task-1", "summary": "First", "assigneeId": "user-1"},
+        {"id": "task-2", "summary": "Second", "assigneeId": "user-2"},
+        {"id": "task-3", "summary": "Third", "assigneeId": "user-3"},
+        {"id": "task-4", "summary": "Fourth", "assigneeId": "user-4"},
+    ]
+    users = {
+        "user-1": {"id": "user-1", "displayName": "Sam Carter", "jiraAccountId": None},
+        "user-2": {"id": "user-2", "displayName": "Sam Carter", "jiraAccountId": None},
+        "user-3": {"id": "user-3", "displayName": "Ghost", "jiraAccountId": None},
+        "user-4": {"id": "user-4", "displayName": "Ghost", "jiraAccountId": None},
+    }
+    repo = FakeRepo(tasks, users=users)
+    jira = FakeJiraClient()
+    lookups: list[str] = []
+
+    def find_user_account_id(display_name: str) -> str | None:
+        lookups.append(display_name)
+        return "jira-sam" if display_name == "Sam Carter" else None
+
+    jira.find_user_account_id = find_user_account_id
+    service = PushTasksToJiraService(repo=repo, jira_client=jira)
+
+    service.push([task["id"] for task in tasks])
+
+    assert sorted(lookups) == ["Ghost", "Sam Carter"]
+    assert users["user-1"]["jiraAccountId"] == users["user-2"]["jiraAccountId"] == "jira-sam"
+
+
+def test_persists_lookup_misses_and_skips_them_until_ttl_expires():
+    task = {"id": "task-1", "summary": "Unknown owner", "assigneeId": "user-1"}
+    users = {"user-1": {"id": "user-1", "displayName": "Ghost", "jiraAccountId": None}}
+    repo = FakeRepo([task], users=users)
+    jira = FakeJiraClient()
+    lookups: list[str] = []
+
+    def find_user_account_id(display_name: str) -> str | None:
+        lookups.append(display_name)
+        return None
+
+    jira.find_user_account_id = find_user_account_id
+    service = PushTasksToJiraService(repo=repo, jira_client=jira, lookup_miss_ttl=timedelta(hours=24))
+
+    service.push([task["id"]])
+    assert lookups == ["Ghost"]
+    assert users["user-1"]["jiraLookupMissAt"]
+
+    service.push([task["id"]])
+    assert lookups == ["Ghost"]
+
+    stale = datetime.now(timezone.utc) - timedelta(hours=25)
+    users["user-1"]["jiraLookupMissAt"] = stale.isoformat()
+    service.push([task["id"]])
+    assert lookups == ["Ghost", "Ghost"]
+
+
+def test_lookup_after_miss_ttl_reaches_jira_http_layer():
+    client = JiraClient(
+        base_url="https://example.atlassian.net",
+        email="bot@example.com",
+        api_token="token",
+        project_key="SCRUM",
+    )
+    searches: list[str] = []
+    jira_users: list[dict] = []
+
+    def fake_request(method, path, payload, **kwargs):
+        if path == "/user/search":
+            searches.append(kwargs["params"]["query"])
+            return list(jira_users)
+        return {"issues": [{"key": f"SCRUM-{index}"} for index, _ in enumerate(payload["issueUpdates"], 1)]}
+
+    client._request = fake_request
+    task = {"id": "task-1", "summary": "New hire task", "assigneeId": "user-1"}
+    users = {"user-1": {"id": "user-1", "displayName": "New Hire", "jiraAccountId": None}}
+    service = PushTasksToJiraService(repo=FakeRepo([task], users=users), jira_client=client)
+
+    service.push([task["id"]])
+    assert searches == ["New Hire"]
+
+    # The user shows up in Jira later; once the persisted miss is stale the same client must ask again.
+    jira_users.append({"accountId": "acc-new"})
+    users["user-1"]["jiraLookupMissAt"] = (datetime.now(timezone.utc) - timedelta(hours=25)).isoformat()
+    service.push([task["id"]])
+
+    assert searches == ["New Hire", "New Hire"]
+    assert users["user-1"]["jiraAccountId"] == "acc-new"
+
+
+def test_bulk_approve_reports_partial_pushes_with_per_task_errors():
+    class HalfJiraClient(FakeJiraClient):
+        def bulk_create_issues(self, payloads):
+            return [None if payload["summary"] == "Bad" else self.create_issue(payload) for payload in payloads]
+
+        def create_issue(self, payload):
+            if payload["summary"] == "Bad":
+                raise JiraClientError("rejected", status_code=400)
+            return super().create_issue(payload)
+
+    tasks = [{"id": "task-1", "summary": "Good"}, {"id": "task-2", "summary": "Bad"}]
+
+    response = bulk_approve_tasks(BulkAction(ids=["task-1", "task-2"]), repo=FakeRepo(tasks), jira=HalfJiraClient())
+
+    assert response.status_code == 207
+    assert json.loads(response.body) == {
+        "updated": 1,
+        "pushed": 1,
+        "skipped": 0,
+        "errors": [{"taskId": "task-2", "error": "rejected"}],
+    }
+
+
+def test_bulk_approve_succeeds_when_a_task_is_deleted_mid_push():
+    class DeletingRepo(FakeRepo):
+        def get_tasks_by_ids(self, ids):
+            found = super().get_tasks_by_ids(ids)
+            self._by_id.pop("task-2")
+            return found
+
+    repo = DeletingRepo([{"id": "task-1", "summary": "Kept"}, {"id": "task-2", "summary": "Deleted"}])
+
+    summary = bulk_approve_tasks(BulkAction(ids=["task-1", "task-2"]), repo=repo, jira=FakeJiraClient())
+
+    assert summary == {"updated": 2, "pushed": 2, "skipped": 0, "errors": []}
+    assert [task_id for task_id, _, _ in repo.marked] == ["task-1", "task-2"]
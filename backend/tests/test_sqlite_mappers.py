@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from backend.infrastructure.persistence.sqlite import SqliteMeetingsRepository, mappers
+from backend.infrastructure.persistence.sqlite.constants import TASK_COLUMNS
+
+
+def _task_tuple(**overrides) -> tuple:
+    values = {
+        "id": "t-1", "meeting_id": "m-1", "summary": "Fix login", "description": None, "issue_type": "Task",
+        "priority": "High", "story_points": 3, "assignee_id": "u-1", "labels": '["backend", "auth"]',
+        "status": "draft", "source_quote": "quote", "jira_issue_key": None, "jira_issue_url": None,
+        "pushed_to_jira_at": None,
+    } | overrides
+    return tuple(values[column] for column in TASK_COLUMNS)
+
+
+def test_serialize_task_row_basic_parses_labels_and_defaults_optional_columns():
+    task = mappers.serialize_task_row_basic(_task_tuple())
+
+    assert task["labels"] == ["backend", "auth"]
+    assert task["description"] == ""
+    assert task["assigneeName"] is None
+    assert task["assigneeAccountId"] is None
+    assert task["jiraIssueKey"] is None
+
+
+def test_serialize_task_row_full_reads_trailing_assignee_columns():
+    task = mappers.serialize_task_row_full((*_task_tuple(labels=None), "acc-9", "Ada"))
+
+    assert (task["assigneeAccountId"], task["assigneeName"]) == ("acc-9", "Ada")
+    assert task["labels"] == []
+
+
+def test_repository_task_reads_serialize_every_column(tmp_path: Path):
+    repo = SqliteMeetingsRepository(f"sqlite:///{tmp_path / 'app.db'}")
+    conn = repo._db.connect()
+    now = "2024-10-05T10:00:00Z"
+    conn.execute(
+        "INSERT INTO meetings(id, title, started_at, created_at) VALUES ('m-1', 'Demo', ?, ?)", (now, now)
+    )
+    conn.execute(
+        "INSERT INTO users(id, display_name, email, jira_account_id) "
+        "VALUES ('u-1', 'Ada', 'ada@example.com', 'acc-1')"
+    )
+    conn.execute(
+        "INSERT INTO tasks(id, meeting_id, summary, issue_type, priority, assignee_id, labels, jira_issue_key, "
+        "created_at, updated_at) VALUES ('t-1', 'm-1', 'Fix login', 'Task', 'High', 'u-1', '[\"auth\"]', 'PROJ-1', ?, ?)",
+        (now, now),
+    )
+    conn.commit()
+    conn.close()
+    expected = {
+        "id": "t-1",
+        "meetingId": "m-1",
+        "summary": "Fix login",
+        "description": "",
+        "issueType": "Task",
+        "priority": "High",
+        "storyPoints": None,
+        "assigneeId": "u-1",
+        "assigneeName": None,
+        "assigneeAccountId": None,
+        "labels": ["auth"],
+        "status": "draft",
+        "sourceQuote": None,
+        "jiraIssueKey": "PROJ-1",
+        "jiraIssueUrl": None,
+        "pushedToJiraAt": None,
+    }
+
+    assert repo.list_tasks(meeting_id="m-1") == [expected]
+    assert repo.get_task("t-1") == expected
+    assert repo.get_tasks_by_ids(["t-1"]) == [expected | {"assigneeAccountId": "acc-1", "assigneeName": "Ada"}]
+
+
+def test_repository_round_trips_jira_lookup_misses(tmp_path: Path):
+    repo = SqliteMeetingsRepository(f"sqlite:///{tmp_path / 'app.db'}")
+    conn = repo._db.connect()
+    conn.execute("INSERT INTO users(id, display_name) VALUES ('u-1', 'Ghost')")
+    conn.commit()
+    conn.close()
+
+    assert repo.get_users(["u-1"])["u-1"]["jiraLookupMissAt"] is None
+    repo.update_user_jira_lookup_miss("u-1", "2024-10-05T10:00:00+00:00")
+
+    assert repo.get_users(["u-1"])["u-1"]["jiraLookupMissAt"] == "2024-10-05T10:00:00+00:00"
+    assert repo.get_user("u-1")["jiraLookupMissAt"] == "2024-10-05T10:00:00+00:00"
+
+
+def test_repository_marks_pushed_tasks_and_returns_missing_ids(tmp_path: Path):
+    repo = SqliteMeetingsRepository(f"sqlite:///{tmp_path / 'app.db'}")
+    conn = repo._db.connect()
+    now = "2024-10-05T10:00:00Z"
+    conn.execute(
+        "INSERT INTO meetings(id, title, started_at, created_at) VALUES ('m-1', 'Demo', ?, ?)", (now, now)
+    )
+    conn.execute(
+        "INSERT INTO tasks(id, meeting_id, summary, issue_type, priority, created_at, updated_at) "
+        "VALUES ('t-1', 'm-1', 'Fix login', 'Task', 'High', ?, ?)",
+        (now, now),
+    )
+    conn.commit()
+    conn.close()
+
+    assert repo.mark_tasks_pushed_to_jira([("t-1", "PROJ-1", None), ("gone", "PROJ-2", None)]) == ["gone"]
+
+    task = repo.get_task("t-1")
+    assert (task["status"], task["jiraIssueKey"]) == ("approved", "PROJ-1")
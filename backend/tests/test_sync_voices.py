@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import hashlib
+from types import SimpleNamespace
+
+from backend.scripts import sync_voices
+
+
+def _blob(etag: str, content: bytes | None = None) -> SimpleNamespace:
+    md5 = bytearray(hashlib.md5(content).digest()) if content is not None else None
+    return SimpleNamespace(etag=etag, content_settings=SimpleNamespace(content_md5=md5))
+
+
+def test_is_current_compares_recorded_etag(tmp_path):
+    local_path = tmp_path / "intro_sam.mp3"
+    local_path.write_bytes(b"old")
+    sync_voices._etag_path(local_path).write_text('"0x1"')
+
+    assert sync_voices._is_current(local_path, _blob('"0x1"'))
+    assert not sync_voices._is_current(local_path, _blob('"0x2"'))
+    assert not sync_voices._is_current(tmp_path / "intro_ada.mp3", _blob('"0x1"'))
+
+
+def test_is_current_adopts_untracked_file_when_content_md5_matches(tmp_path):
+    local_path = tmp_path / "intro_sam.mp3"
+    local_path.write_bytes(b"voice")
+
+    assert not sync_voices._is_current(local_path, _blob('"0x3"', b"other"))
+    assert sync_voices._is_current(local_path, _blob('"0x3"', b"voice"))
+    assert sync_voices._etag_path(local_path).read_text() == '"0x3"'
+
+
+def test_predecode_uses_the_transcriber_pcm_format(monkeypatch, tmp_path):
+    monkeypatch.setenv("TRANSCRIBER_SAMPLE_RATE", "8000")
+    monkeypatch.setenv("TRANSCRIBER_CHANNELS", "2")
+    sync_voices.get_settings.cache_clear()
+    calls: list[dict] = []
+    monkeypatch.setattr(sync_voices.normalizer, "write_pcm_sidecar", lambda path, **kwargs: calls.append(kwargs))
+
+    try:
+        sync_voices._predecode(tmp_path / "intro_sam.mp3")
+    finally:
+        sync_voices.get_settings.cache_clear()
+
+    assert (calls[0]["sample_rate"], calls[0]["channels"]) == (8000, 2)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from backend.application.services.voice_profiles import VoiceSamplesSyncService
 from backend.infrastructure.persistence.sqlite import SqliteMeetingsRepository
 from backend.schemas import ExtractionResult, IssueType, Priority, Task
 
@@ -79,3 +80,32 @@ def test_update_user_voice_sample(tmp_path):
     repo.update_user_voice_sample(user_id, "Carla Ruiz", "data/voices/carla_new.mp3")
     users = repo.list_users()
     assert users[0]["voiceSamplePath"] == "data/voices/carla_new.mp3"
+
+
+def test_voice_sync_streams_blob_into_destination(tmp_path):
+    class FakeDownloader:
+        def readinto(self, handle):
+            handle.write(b"intro-bytes")
+            return len(b"intro-bytes")
+
+    class FakeBlobClient:
+        def download_blob(self, max_concurrency=1):
+            assert max_concurrency == 4
+            return FakeDownloader()
+
+    class FakeContainer:
+        def list_blobs(self, name_starts_with=None):
+            return [type("Blob", (), {"name": "intro_sam_carter.mp3"})()]
+
+        def get_blob_client(self, name):
+            return FakeBlobClient()
+
+    syncer = VoiceSamplesSyncService.__new__(VoiceSamplesSyncService)
+    syncer._target_dir = tmp_path
+    syncer._container = FakeContainer()
+
+    samples = syncer.sync()
+
+    assert [sample.display_name for sample in samples] == ["Sam Carter"]
+    assert (tmp_path / "intro_sam_carter.mp3").read_bytes() == b"intro-bytes"
+    assert not list(tmp_path.glob("*.part"))
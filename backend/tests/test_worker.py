@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_importing_worker_leaves_env_dependent_modules_unloaded():
+    # Modules such as sqlite.constants read DB_URL at import time, so they must load after main() reads .env.
+    probe = (
+        "import sys, backend.worker; "
+        "print(any(name in sys.modules for name in "
+        "('backend.container', 'backend.infrastructure.persistence.sqlite.constants', 'backend.mlflow_logging')))"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
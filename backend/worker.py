@@ -1,17 +1,31 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import os
+import signal
+from collections.abc import Callable
+
 from dotenv import load_dotenv
 
-from backend.container import get_meeting_queue_worker
+logger = logging.getLogger(__name__)
 
-load_dotenv()
 
-logger = logging.getLogger(__name__)
+def _on_shutdown_signal(callback: Callable[[], None]) -> None:
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        with contextlib.suppress(NotImplementedError):  # pragma: no cover - no signal handlers on Windows loops
+            loop.add_signal_handler(sig, callback)
 
 
 async def main() -> None:
+    # Read .env once per process rather than on import; LOAD_DOTENV=0 skips it when the env is injected.
+    # The container is imported afterwards because its modules read settings such as DB_URL at import time.
+    if os.getenv("LOAD_DOTENV", "1") == "1":
+        load_dotenv()
+    from backend.container import get_meeting_queue_worker
+
     try:
         worker = get_meeting_queue_worker()
     except Exception:  # pragma: no cover - defensive
@@ -27,12 +41,22 @@ async def main() -> None:
             "Set AZURE_STORAGE_QUEUE_NAME and the matching connection string to enable the worker. "
             "Worker will stay idle instead of exiting."
         )
-        # Keep the container alive to avoid crash-loop when queue is intentionally absent.
-        while True:
-            await asyncio.sleep(60)
+        # Keep the container alive to avoid crash-loop when queue is intentionally absent,
+        # sleeping on an event rather than a timer until the container is asked to stop.
+        stop_requested = asyncio.Event()
+        _on_shutdown_signal(stop_requested.set)
+        await stop_requested.wait()
+        return
     logger.info("Starting Azure queue worker")
+    _on_shutdown_signal(worker.stop)
     await worker.run_forever()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop ships with uvicorn[standard] on non-Windows platforms; fall back to the stdlib loop elsewhere.
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - platform dependent
+        asyncio.run(main())
+    else:
+        uvloop.run(main())